@@ -24,6 +24,7 @@ if sys.platform == "win32":
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 import time
 import shutil
+import threading
 from pathlib import Path
 
 # Add current directory to path
@@ -86,22 +87,56 @@ LOCAL_PROJECTS = TOOL_DIR / "PROJECTS"
 WORKER_CHANNEL = get_channel_from_folder()
 
 
+def _scandir_names(directory: Path, suffixes: tuple) -> frozenset:
+    """1 lần scandir → set tên file theo suffix. Thay cho glob/stat từng file."""
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(
+                e.name for e in it
+                if e.name.endswith(suffixes) and e.is_file(follow_symlinks=False)
+            )
+    except (OSError, PermissionError):
+        return frozenset()
+
+
+def _load_wb(excel_path: Path):
+    """Load PromptWorkbook với cache chung (keyed theo path + mtime_ns)."""
+    from modules.excel_manager import load_workbook_cached
+    return load_workbook_cached(excel_path)
+
+
+# SmartEngine dùng chung cho bước ảnh + bước video (cùng worker_id=0).
+# Double-checked locking: không bao giờ tạo 2 engine trùng token pool.
+_engine_lock = threading.Lock()
+_shared_engine = None
+
+
+def _get_shared_engine():
+    """Lấy SmartEngine dùng chung, khởi tạo lần đầu (thread-safe)."""
+    global _shared_engine
+    if _shared_engine is None:
+        with _engine_lock:
+            if _shared_engine is None:
+                from modules.smart_engine import SmartEngine
+                _shared_engine = SmartEngine(worker_id=0, total_workers=2)
+    return _shared_engine
+
+
 def is_local_pic_complete(project_dir: Path, name: str) -> bool:
     """Check if local project has ALL images created (both Chrome 1 and 2)."""
     img_dir = project_dir / "img"
     if not img_dir.exists():
         return False
 
-    img_files = list(img_dir.glob("*.png")) + list(img_dir.glob("*.jpg"))
+    img_files = _scandir_names(img_dir, (".png", ".jpg"))
 
     if len(img_files) == 0:
         return False
 
     try:
-        from modules.excel_manager import PromptWorkbook
         excel_path = project_dir / f"{name}_prompts.xlsx"
         if excel_path.exists():
-            wb = PromptWorkbook(str(excel_path))
+            wb = _load_wb(excel_path)
             scenes = wb.get_scenes()
             expected = len([s for s in scenes if s.img_prompt])
 
@@ -140,8 +175,6 @@ def create_videos_for_project_parallel(project_dir: Path, code: str, callback=No
             print(msg)
 
     try:
-        from modules.smart_engine import SmartEngine
-
         excel_path = project_dir / f"{code}_prompts.xlsx"
         if not excel_path.exists():
             log(f"  No Excel found for video creation!", "ERROR")
@@ -150,7 +183,7 @@ def create_videos_for_project_parallel(project_dir: Path, code: str, callback=No
         log(f"\n[VIDEO] Creating videos PARALLEL (Chrome 1 = chẵn)...")
 
         # Chrome 1: worker_id=0, total_workers=2 → video chẵn (2,4,6...)
-        engine = SmartEngine(worker_id=0, total_workers=2)
+        engine = _get_shared_engine()
 
         result = engine.run(
             str(excel_path),
@@ -179,13 +212,12 @@ def is_local_video_complete(project_dir: Path, name: str) -> bool:
     if not img_dir.exists():
         return False
 
-    video_files = list(img_dir.glob("*.mp4"))
+    video_files = _scandir_names(img_dir, (".mp4",))
 
     try:
-        from modules.excel_manager import PromptWorkbook
         excel_path = project_dir / f"{name}_prompts.xlsx"
         if excel_path.exists():
-            wb = PromptWorkbook(str(excel_path))
+            wb = _load_wb(excel_path)
             scenes = wb.get_scenes()
             # Đếm scenes cần video (có video_prompt hoặc có img và video_count > 0)
             expected_videos = len([s for s in scenes if s.img_prompt])  # Mỗi scene 1 video
@@ -258,13 +290,8 @@ def process_project_full(code: str, callback=None) -> bool:
 
     # Step 4: Create images using SmartEngine
     try:
-        from modules.smart_engine import SmartEngine
-
         # Chrome 1: worker_id=0, total_workers=2 (chia scenes với Chrome 2)
-        engine = SmartEngine(
-            worker_id=0,
-            total_workers=2
-        )
+        engine = _get_shared_engine()
 
         log(f"  Excel: {excel_path.name}")
         log(f"  Mode: CHROME 1 FULL (scenes chẵn: 2,4,6,... + nv/loc)")
@@ -24,6 +24,15 @@ if sys.platform == "win32":
     if sys.stderr:
         sys.stderr.reconfigure(encoding='utf-8', errors='replace')
     os.environ['PYTHONIOENCODING'] = 'utf-8'
+    # VM Manager launch worker trực tiếp (không còn qua "start title cmd /k")
+    # nên console không tự có title - tự đặt từ env để hide/show theo title
+    _title = os.environ.get('VE3_CONSOLE_TITLE')
+    if _title:
+        try:
+            import ctypes
+            ctypes.windll.kernel32.SetConsoleTitleW(_title)
+        except Exception:
+            pass
 
 import time
 import shutil
@@ -39,7 +48,8 @@ sys.path.insert(0, str(TOOL_DIR))
 # ================================================================================
 
 # Worker ID for this Chrome worker
-WORKER_ID = "chrome_2"
+# VM Manager có thể override qua env (worker 3+ dùng chung script này)
+WORKER_ID = os.environ.get("VE3_WORKER_ID", "chrome_2")
 
 # Agent Protocol - giao tiếp với VM Manager
 try:
@@ -180,10 +190,10 @@ def is_local_pic_complete(project_dir: Path, name: str) -> bool:
         return False
 
     try:
-        from modules.excel_manager import PromptWorkbook
+        from modules.excel_manager import load_workbook_cached
         excel_path = project_dir / f"{name}_prompts.xlsx"
         if excel_path.exists():
-            wb = PromptWorkbook(str(excel_path))
+            wb = load_workbook_cached(excel_path)
             scenes = wb.get_scenes()
             expected = len([s for s in scenes if s.img_prompt])
 
@@ -500,11 +510,11 @@ def process_project_with_agent(code: str) -> bool:
     current_scene = [0]  # Use list to allow modification in callback
 
     try:
-        from modules.excel_manager import PromptWorkbook
+        from modules.excel_manager import load_workbook_cached
         local_dir = LOCAL_PROJECTS / code
         excel_path = local_dir / f"{code}_prompts.xlsx"
         if excel_path.exists():
-            wb = PromptWorkbook(str(excel_path))
+            wb = load_workbook_cached(excel_path)
             total_scenes = len(wb.get_scenes())
     except:
         pass
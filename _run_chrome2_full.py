@@ -24,6 +24,7 @@ if sys.platform == "win32":
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 import time
 import shutil
+import threading
 from pathlib import Path
 
 # Add current directory to path
@@ -102,6 +103,31 @@ def get_chrome2_path():
     return None
 
 
+# SmartEngine dùng chung cho bước ảnh + bước video (cùng worker_id=1).
+# Double-checked locking: không bao giờ tạo 2 engine trùng token pool.
+_engine_lock = threading.Lock()
+_shared_engine = None
+
+
+def _get_shared_engine(chrome2_path: str):
+    """Lấy SmartEngine dùng chung, khởi tạo lần đầu (thread-safe).
+
+    chrome2_path chỉ dùng ở lần khởi tạo đầu tiên - các lần sau trả về
+    engine đã có (path không đổi trong 1 phiên chạy).
+    """
+    global _shared_engine
+    if _shared_engine is None:
+        with _engine_lock:
+            if _shared_engine is None:
+                from modules.smart_engine import SmartEngine
+                _shared_engine = SmartEngine(
+                    worker_id=1,
+                    total_workers=2,
+                    chrome_portable=chrome2_path
+                )
+    return _shared_engine
+
+
 def is_local_pic_complete(project_dir: Path, name: str) -> bool:
     """Check if local project has ALL images created."""
     img_dir = project_dir / "img"
@@ -114,10 +140,10 @@ def is_local_pic_complete(project_dir: Path, name: str) -> bool:
         return False
 
     try:
-        from modules.excel_manager import PromptWorkbook
+        from modules.excel_manager import load_workbook_cached
         excel_path = project_dir / f"{name}_prompts.xlsx"
         if excel_path.exists():
-            wb = PromptWorkbook(str(excel_path))
+            wb = load_workbook_cached(excel_path)
             scenes = wb.get_scenes()
             expected = len([s for s in scenes if s.img_prompt])
 
@@ -155,8 +181,6 @@ def create_videos_for_project_chrome2(project_dir: Path, code: str, chrome2_path
             print(f"[Chrome2] {msg}")
 
     try:
-        from modules.smart_engine import SmartEngine
-
         excel_path = project_dir / f"{code}_prompts.xlsx"
         if not excel_path.exists():
             log(f"  No Excel found for video creation!", "ERROR")
@@ -165,11 +189,7 @@ def create_videos_for_project_chrome2(project_dir: Path, code: str, chrome2_path
         log(f"\n[VIDEO] Creating videos (Chrome 2 = scenes lẻ)...")
 
         # Chrome 2: worker_id=1, total_workers=2 → video lẻ (1,3,5...)
-        engine = SmartEngine(
-            worker_id=1,
-            total_workers=2,
-            chrome_portable=chrome2_path
-        )
+        engine = _get_shared_engine(chrome2_path)
 
         result = engine.run(
             str(excel_path),
@@ -279,14 +299,8 @@ def process_project_full_chrome2(code: str, callback=None) -> bool:
 
     # Step 4: Create IMAGES using SmartEngine (scenes lẻ)
     try:
-        from modules.smart_engine import SmartEngine
-
         # Chrome 2: worker_id=1, total_workers=2
-        engine = SmartEngine(
-            worker_id=1,
-            total_workers=2,
-            chrome_portable=chrome2_path
-        )
+        engine = _get_shared_engine(chrome2_path)
 
         log(f"  Excel: {excel_path.name}")
         log(f"  Mode: CHROME 2 FULL (scenes lẻ: 1,3,5,...)")
@@ -47,6 +47,7 @@ if sys.platform == "win32":
 
 
 import json
+import re
 import time
 import threading
 from pathlib import Path
@@ -55,6 +56,14 @@ from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+# Optional: Aho-Corasick cho prefilter token lỗi (1 pass O(len) thay vì
+# 1 lượt str.__contains__ mỗi token). Không có thì fallback any().
+try:
+    import ahocorasick
+    AHOCORASICK_ENABLED = True
+except ImportError:
+    AHOCORASICK_ENABLED = False
+
 # ================================================================================
 # PATHS
 # ================================================================================
@@ -197,14 +206,84 @@ ERROR_PATTERNS = {
 }
 
 
-def detect_error_type(message: str) -> ErrorType:
-    """Detect loại lỗi từ message."""
-    import re
-    for error_type, patterns in ERROR_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, message, re.IGNORECASE):
+# Precompile 1 lần lúc import: gộp patterns mỗi loại thành 1 alternation
+# regex, walk theo đúng thứ tự khai báo trong ERROR_PATTERNS - thứ tự là
+# độ ưu tiên phân loại ("Timeout: 403 Forbidden" phải ra CHROME_403, không
+# phải NETWORK_ERROR vì "Timeout" đứng trước trong chuỗi). 1 search
+# C-level mỗi loại; prefilter phía dưới đã loại sẵn dòng lành.
+_ERROR_RES = tuple(
+    (error_type, re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE))
+    for error_type, patterns in ERROR_PATTERNS.items()
+)
+
+
+# Prefilter rẻ trước khi vào regex: đa số log line không chứa token lỗi
+# nào, 1 lượt str.__contains__ (C-level) loại sớm khỏi phải walk các
+# alternation. Token rút tự động từ ERROR_PATTERNS: đoạn literal dài nhất
+# của mỗi pattern - thêm/sửa pattern thì prefilter tự theo, không phải
+# nhớ cập nhật tay.
+
+
+def _literal_core(pattern: str) -> str:
+    """Đoạn literal dài nhất chắc chắn xuất hiện trong mọi match của pattern."""
+    cleaned = re.sub(r"\\[dwsDWS][+*]?|\[[^\]]*\][+*]?|[().*+?|^$\\{}]", "\x00", pattern)
+    parts = (p.strip().lower() for p in cleaned.split("\x00"))
+    return max((p for p in parts if p), key=len, default="")
+
+
+_cores = [_literal_core(p) for patterns in ERROR_PATTERNS.values() for p in patterns]
+# Pattern nào không có literal thì prefilter không còn là superset an toàn
+# → tắt prefilter (tuple rỗng = luôn vào regex)
+_FAST_TOKENS = tuple(sorted(set(_cores))) if all(_cores) else ()
+
+if AHOCORASICK_ENABLED and _FAST_TOKENS:
+    _FAST_AC = ahocorasick.Automaton()
+    for _tok in _FAST_TOKENS:
+        _FAST_AC.add_word(_tok, _tok)
+    _FAST_AC.make_automaton()
+
+
+def _has_fast_token(lo: str) -> bool:
+    """Prefilter: lo (đã lowercase) có chứa token lỗi nào không."""
+    if not _FAST_TOKENS:
+        return True
+    if AHOCORASICK_ENABLED:
+        return next(_FAST_AC.iter(lo), None) is not None
+    return any(t in lo for t in _FAST_TOKENS)
+
+
+# Cache timestamp theo độ phân giải giây: log dày đặc thì khỏi tốn
+# gettimeofday + datetime alloc + strftime cho từng dòng
+_ts_cache = [0, ""]
+
+
+def _log_timestamp() -> str:
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache[0] = sec
+        _ts_cache[1] = time.strftime("%H:%M:%S", time.localtime(sec))
+    return _ts_cache[1]
+
+
+def _make_detect_error_type(_error_res=_ERROR_RES,
+                            _has_token=_has_fast_token,
+                            _unknown=ErrorType.UNKNOWN) -> Callable[[str], ErrorType]:
+    """
+    Specialize detect_error_type 1 lần lúc import: bind regex/map/token vào
+    default args (local load) - hot path khỏi tra cứu global mỗi dòng log.
+    """
+    def detect_error_type(message: str) -> ErrorType:
+        """Detect loại lỗi từ message."""
+        if not _has_token(message.lower()):
+            return _unknown
+        for error_type, pattern_re in _error_res:
+            if pattern_re.search(message):
                 return error_type
-    return ErrorType.UNKNOWN
+        return _unknown
+    return detect_error_type
+
+
+detect_error_type = _make_detect_error_type()
 
 
 # ================================================================================
@@ -236,8 +315,7 @@ class AgentWorker:
 
     def log(self, message: str, level: str = "INFO"):
         """Ghi log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        line = f"[{timestamp}] [{level}] {message}\n"
+        line = f"[{_log_timestamp()}] [{level}] {message}\n"
 
         # Ghi vào file
         if self._log_file:
@@ -462,8 +540,17 @@ class AgentManager:
             return []
 
         try:
-            with open(log_path, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
+            # Tail read: chỉ đọc khúc cuối file thay vì readlines() cả file
+            # (log worker chạy lâu lên hàng trăm MB, manager/GUI gọi liên tục)
+            chunk = max(lines * 256, 8192)
+            with open(log_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(0, size - chunk))
+                data = f.read()
+            all_lines = data.decode('utf-8', errors='ignore').splitlines(keepends=True)
+            if size > chunk and all_lines:
+                all_lines = all_lines[1:]  # dòng đầu có thể bị cắt giữa chừng
             return all_lines[-lines:]
         except Exception:
             return []
@@ -2162,3 +2162,65 @@ class PromptWorkbook:
                 return float(ts)
         except:
             return 0
+
+
+# ================================================================================
+# CACHED LOADER
+# ================================================================================
+
+# Cache workbook đã parse, keyed theo (path, mtime_ns).
+# Các hàm check completeness (pic/video) gọi liên tục trong scan/wait loop -
+# parse lại Excel bằng openpyxl mỗi lần tốn ~100-500ms.
+_WB_CACHE: Dict[str, tuple] = {}
+
+
+def load_workbook_cached(path: Union[str, Path]) -> "PromptWorkbook":
+    """
+    Load PromptWorkbook với cache - chỉ parse lại khi file đổi (st_mtime_ns).
+
+    CHỈ dùng cho đọc (get_scenes, get_stats...). Code có update/save workbook
+    phải tự tạo PromptWorkbook riêng để không ghi đè lên bản cache.
+    """
+    path = Path(path) if isinstance(path, str) else path
+    key = str(path)
+    mtime = path.stat().st_mtime_ns
+
+    cached = _WB_CACHE.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    wb = PromptWorkbook(path)
+    wb.load_or_create()
+    _WB_CACHE[key] = (mtime, wb)
+    return wb
+
+
+def iter_prompt_rows(path: Union[str, Path]):
+    """
+    Stream đọc prompts từ Excel trong 1 pass read_only/data_only.
+
+    Khác load_workbook thường: không build cell/style objects, chỉ raw values
+    - nhanh hơn nhiều với project hàng trăm scenes. CHỈ dùng để đọc.
+
+    Yields:
+        ("character", dict theo CHARACTERS_COLUMNS) - gồm cả locations
+        (locations nằm chung sheet characters với role="location")
+        ("scene", dict theo SCENES_COLUMNS)
+    """
+    wb = load_workbook(Path(path) if isinstance(path, str) else path,
+                       read_only=True, data_only=True)
+    try:
+        if PromptWorkbook.CHARACTERS_SHEET in wb.sheetnames:
+            ws = wb[PromptWorkbook.CHARACTERS_SHEET]
+            for row in ws.iter_rows(min_row=2, values_only=True):
+                if not row or row[0] is None:
+                    continue
+                yield "character", dict(zip(CHARACTERS_COLUMNS, row))
+        if PromptWorkbook.SCENES_SHEET in wb.sheetnames:
+            ws = wb[PromptWorkbook.SCENES_SHEET]
+            for row in ws.iter_rows(min_row=2, values_only=True):
+                if not row or row[0] is None:
+                    continue
+                yield "scene", dict(zip(SCENES_COLUMNS, row))
+    finally:
+        wb.close()
@@ -42,9 +42,15 @@ from dataclasses import dataclass, field
 
 # Import từ modules hiện có
 from modules.browser_flow_generator import BrowserFlowGenerator
-from modules.excel_manager import PromptWorkbook
+from modules.excel_manager import PromptWorkbook, iter_prompt_rows
 from modules.utils import get_logger, load_settings
 
+# FastRLock (C-level, fast path khi không tranh chấp) nếu có, fallback Lock chuẩn
+try:
+    from fastrlock.rlock import FastRLock
+except ImportError:
+    FastRLock = threading.Lock
+
 
 @dataclass
 class ParallelStats:
@@ -142,13 +148,12 @@ class ParallelFlowGenerator:
             default_profile.mkdir(parents=True, exist_ok=True)
             self.available_profiles = ["main"]
 
-        # Lock cho thread-safe
-        self._lock = threading.Lock()
-        self._results: Dict[str, Any] = {}
+        # Kết quả do worker TRẢ VỀ (thread-local), aggregate trên main thread
+        # → không cần lock/shared dict cho kết quả
 
         # QUAN TRỌNG: Lock cho download - chỉ 1 browser download tại 1 thời điểm
         # Tránh nhầm lẫn ảnh khi nhiều browser cùng download
-        self._download_lock = threading.Lock()
+        self._download_lock = FastRLock()
         self._download_queue_enabled = True  # Bật xếp hàng download
 
     def _log(self, message: str, level: str = "info") -> None:
@@ -187,12 +192,16 @@ class ParallelFlowGenerator:
         ref_prompts = []
         scene_prompts = []
 
+        # Bind local cho hot loop (local lookup nhanh hơn attr lookup).
+        # Không cần sort lại: prompts đã theo thứ tự scene từ Excel.
+        ref_append = ref_prompts.append
+        scene_append = scene_prompts.append
+
         for p in prompts:
-            pid = str(p.get('id', ''))
-            if pid.startswith('nv') or pid.startswith('loc'):
-                ref_prompts.append(p)
+            if str(p.get('id', '')).startswith(('nv', 'loc')):
+                ref_append(p)
             else:
-                scene_prompts.append(p)
+                scene_append(p)
 
         return ref_prompts, scene_prompts
 
@@ -440,34 +449,31 @@ class ParallelFlowGenerator:
         self._log(f"Project: {self.project_path.name}")
         self._log(f"Browsers: {self.num_browsers}")
 
-        # Load Excel
-        workbook = PromptWorkbook(excel_path)
-        workbook.load_or_create()
-
-        # Lấy tất cả prompts
+        # Load Excel - stream 1 pass read_only/data_only
+        # (không parse style/cell objects như load_or_create)
         all_prompts = []
 
-        # Characters
-        for char in workbook.get_characters():
-            if char.english_prompt:
-                if char.status == "done" and not overwrite:
+        for kind, data in iter_prompt_rows(excel_path):
+            if kind == "character":
+                # Gồm cả nv* và loc* (locations chung sheet characters)
+                if not data.get('english_prompt'):
+                    continue
+                if str(data.get('status', '')) == "done" and not overwrite:
                     continue
                 all_prompts.append({
-                    'id': char.id,
-                    'prompt': char.english_prompt,
+                    'id': str(data.get('id', '')),
+                    'prompt': data['english_prompt'],
                     'reference_files': []
                 })
-
-        # Scenes
-        for scene in workbook.get_scenes():
-            if scene.img_prompt:
-                if scene.status_img == "done" and not overwrite:
+            else:  # scene
+                if not data.get('img_prompt'):
+                    continue
+                if str(data.get('status_img', '')) == "done" and not overwrite:
                     continue
-                ref_str = getattr(scene, 'reference_files', '') or ''
                 all_prompts.append({
-                    'id': str(scene.scene_id),
-                    'prompt': scene.img_prompt,
-                    'reference_files': ref_str
+                    'id': str(data.get('scene_id', '')),
+                    'prompt': data['img_prompt'],
+                    'reference_files': data.get('reference_files') or ''
                 })
 
         if not all_prompts:
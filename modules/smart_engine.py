@@ -99,6 +99,74 @@ def _release_token_extraction_slot(profile_name: str, logger=None):
             logger(f"[TokenQueue] {profile_name}: Xong! ({remaining} thread đang đợi)")
 
 
+class _LogBuffer:
+    """
+    Gom log lines trong hot loop roi flush 1 cuc - giam so lan danh thuc
+    GUI callback (moi anh ~4 log lines, project 200 scene = ~800 wakeups).
+
+    Flush khi: du max_lines, qua max_ms ke tu line dau, hoac gap
+    ERROR/WARN (flush ngay de khong tre bao loi).
+    """
+
+    def __init__(self, emit, max_lines: int = 16, max_ms: int = 250):
+        self.emit = emit  # nhan 1 string (co the nhieu dong)
+        self.max_lines = max_lines
+        self.max_s = max_ms / 1000.0
+        self.lines = []
+        self.first_ts = 0.0
+        self._lock = threading.Lock()
+
+    def log(self, msg: str, level: str = "INFO"):
+        line = f"[{time.strftime('%H:%M:%S')}] {msg}"
+        with self._lock:
+            if not self.lines:
+                self.first_ts = time.monotonic()
+            self.lines.append(line)
+            if (level not in ("ERROR", "WARN")
+                    and len(self.lines) < self.max_lines
+                    and time.monotonic() - self.first_ts <= self.max_s):
+                return
+            out = "\n".join(self.lines)
+            self.lines = []
+        self.emit(out)
+
+    def flush(self):
+        """Day not nhung line con lai (goi cuoi round/batch)."""
+        with self._lock:
+            if not self.lines:
+                return
+            out = "\n".join(self.lines)
+            self.lines = []
+        self.emit(out)
+
+
+class _TokenBucket:
+    """
+    Rate limiter kieu token bucket - thay cho time.sleep co dinh giua cac anh.
+
+    Chi ngu dung khoang thoi gian con thieu token, khong ngu thua:
+    may khoe + API thoang thi chay het toc, bi gioi han thi tu cham lai.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = max(rate, 0.1)  # tokens/giay
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, n: int = 1):
+        """Lay n token, ngu dung bang thoi gian thieu (neu thieu)."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
 @dataclass
 class Resource:
     """Tai nguyen (profile hoac API key)."""
@@ -176,6 +244,9 @@ class SmartEngine:
         self.stop_flag = False
         self.callback = None
         self._lock = threading.Lock()
+        # Single-flight cho token refresh: thread dau tien refresh,
+        # cac thread den sau doi event thay vi refresh trung lap
+        self._refresh_event = None
 
         # Parallel processing state
         self._character_gen_thread = None
@@ -220,7 +291,8 @@ class SmartEngine:
         if level == "DEBUG" and not self.verbose_log:
             return
 
-        ts = datetime.now().strftime("%H:%M:%S")
+        # time.strftime la C-native, khong phai tao datetime object moi log line
+        ts = time.strftime("%H:%M:%S")
         # Simplify format - remove redundant level for OK/ERROR
         if level in ("OK", "ERROR", "WARN"):
             full_msg = f"[{ts}] {msg}"
@@ -237,6 +309,16 @@ class SmartEngine:
             except UnicodeEncodeError:
                 print(full_msg.encode('ascii', 'replace').decode('ascii'))
 
+    def _emit_raw(self, text: str):
+        """Day text da format (co the nhieu dong) ra callback/console."""
+        if self.callback:
+            self.callback(text)
+        else:
+            try:
+                print(text)
+            except UnicodeEncodeError:
+                print(text.encode('ascii', 'replace').decode('ascii'))
+
     def load_config(self):
         """Load config."""
         root_dir = Path(__file__).parent.parent.resolve()
@@ -371,7 +453,7 @@ class SmartEngine:
             loaded = 0
 
             for profile in self.profiles:
-                profile_name = Path(profile.value).name
+                profile_name = os.path.basename(profile.value)
                 if profile_name in data:
                     token_data = data[profile_name]
 
@@ -423,12 +505,12 @@ class SmartEngine:
 
     def get_cached_media_name(self, profile: 'Resource', image_id: str) -> str:
         """Lay media_name tu cache cho profile + image_id."""
-        profile_name = Path(profile.value).name
+        profile_name = os.path.basename(profile.value)
         return self.media_name_cache.get(profile_name, {}).get(image_id, "")
 
     def set_cached_media_name(self, profile: 'Resource', image_id: str, media_name: str):
         """Luu media_name vao cache."""
-        profile_name = Path(profile.value).name
+        profile_name = os.path.basename(profile.value)
         if profile_name not in self.media_name_cache:
             self.media_name_cache[profile_name] = {}
         self.media_name_cache[profile_name][image_id] = media_name
@@ -440,7 +522,7 @@ class SmartEngine:
             data = {}
             for profile in self.profiles:
                 if profile.token:
-                    profile_name = Path(profile.value).name
+                    profile_name = os.path.basename(profile.value)
                     data[profile_name] = {
                         'token': profile.token,
                         'project_id': profile.project_id,
@@ -477,7 +559,7 @@ class SmartEngine:
             reason: Ly do (de log)
         """
         profile.token_invalid = True
-        self.log(f"[Token] {Path(profile.value).name} bi danh dau INVALID: {reason}", "WARN")
+        self.log(f"[Token] {os.path.basename(profile.value)} bi danh dau INVALID: {reason}", "WARN")
 
     def refresh_token_on_error(self, profile: Resource) -> bool:
         """Refresh token khi API loi (401).
@@ -490,14 +572,34 @@ class SmartEngine:
         Returns:
             True neu refresh thanh cong
         """
-        self.log(f"[Token] Refresh token cho {Path(profile.value).name} (giu project_id: {profile.project_id[:8] if profile.project_id else 'N/A'}...)")
+        # Single-flight: batch co the co nhieu thread cung dinh 401 1 luc.
+        # Chi thread dau tien extract token, thread sau doi ket qua -
+        # KHONG giu self._lock qua I/O, chi giu luc doc/ghi _refresh_event.
+        with self._lock:
+            ev = self._refresh_event
+            if ev is None:
+                ev = self._refresh_event = threading.Event()
+                leader = True
+            else:
+                leader = False
 
-        # Reset flag
-        profile.token_invalid = False
-        profile.token = ""
+        if not leader:
+            ev.wait(timeout=60)
+            return bool(profile.token)
 
-        # Lay token moi (se reuse project_id)
-        return self.get_token_for_profile(profile)
+        try:
+            self.log(f"[Token] Refresh token cho {os.path.basename(profile.value)} (giu project_id: {profile.project_id[:8] if profile.project_id else 'N/A'}...)")
+
+            # Reset flag
+            profile.token_invalid = False
+            profile.token = ""
+
+            # Lay token moi (se reuse project_id)
+            return self.get_token_for_profile(profile)
+        finally:
+            with self._lock:
+                self._refresh_event = None
+            ev.set()
 
     def get_valid_token_count(self) -> int:
         """Dem so token con valid."""
@@ -666,7 +768,7 @@ class SmartEngine:
         """
         from modules.auto_token import ChromeAutoToken
 
-        profile_name = Path(profile.value).name
+        profile_name = os.path.basename(profile.value)
         self.log(f"[Chrome] Lay token: {profile_name}...")
 
         # Log project_id status
@@ -832,7 +934,7 @@ class SmartEngine:
                 if self.stop_flag:
                     break
 
-                self.log(f"[{i+1}/{len(self.profiles)}] {Path(profile.value).name}")
+                self.log(f"[{i+1}/{len(self.profiles)}] {os.path.basename(profile.value)}")
 
                 if self.is_token_valid(profile):
                     self.log(f"  -> Da co token valid, skip")
@@ -1095,6 +1197,20 @@ class SmartEngine:
         prompts = []
         wb = openpyxl.load_workbook(excel_path)
 
+        # Hoist ra ngoài loop: load media_ids 1 lần + path nv/ 1 lần
+        # (trước đây mỗi row nv/loc tồn tại lại parse cả workbook để check)
+        nv_path_str = str(proj_dir / "nv")
+        media_id_keys = set()
+        media_ids_ok = False
+        try:
+            from modules.excel_manager import PromptWorkbook
+            wb_check = PromptWorkbook(excel_path)
+            wb_check.load_or_create()
+            media_id_keys = {k.lower() for k in wb_check.get_media_ids().keys()}
+            media_ids_ok = True
+        except Exception as e:
+            self.log(f"[CHAR] Lỗi load media_ids: {e}", "WARN")
+
         for sheet_name in wb.sheetnames:
             ws = wb[sheet_name]
 
@@ -1158,26 +1274,15 @@ class SmartEngine:
                     need_generate = False
                     if not out_path.exists():
                         need_generate = True
-                    else:
-                        # Kiểm tra media_id trong Excel
+                    elif media_ids_ok and pid_str.lower() not in media_id_keys:
+                        # Ảnh tồn tại nhưng KHÔNG có media_id → tạo lại
+                        self.log(f"[CHAR] {pid_str}: Ảnh tồn tại nhưng KHÔNG có media_id → tạo lại")
                         try:
-                            from modules.excel_manager import PromptWorkbook
-                            wb_check = PromptWorkbook(excel_path)
-                            wb_check.load_or_create()
-                            media_ids = wb_check.get_media_ids()
-                            # Case-insensitive check
-                            has_media_id = any(k.lower() == pid_str.lower() for k in media_ids.keys())
-                            if not has_media_id:
-                                self.log(f"[CHAR] {pid_str}: Ảnh tồn tại nhưng KHÔNG có media_id → tạo lại")
-                                # Xóa file cũ
-                                try:
-                                    out_path.unlink()
-                                    self.log(f"[CHAR] Đã xóa {out_path.name}")
-                                except:
-                                    pass
-                                need_generate = True
-                        except Exception as e:
-                            self.log(f"[CHAR] Lỗi kiểm tra media_id: {e}", "WARN")
+                            out_path.unlink()
+                            self.log(f"[CHAR] Đã xóa {out_path.name}")
+                        except:
+                            pass
+                        need_generate = True
 
                     if need_generate:
                         prompts.append({
@@ -1185,7 +1290,7 @@ class SmartEngine:
                             'prompt': prompt_str,
                             'output_path': str(out_path),
                             'reference_files': "",
-                            'nv_path': str(proj_dir / "nv")
+                            'nv_path': nv_path_str
                         })
 
         return prompts
@@ -1687,6 +1792,32 @@ class SmartEngine:
                 self.log(f"Image error {pid}: {e}", "ERROR")
             return False, token_expired
 
+    def generate_images_batch(self, prompts: List[Dict], profile: Resource, batch_size: int = 8) -> List[tuple]:
+        """
+        Tao 1 lo anh tren cung 1 profile - gop batch_size request HTTP 1 luot.
+
+        Submit song song qua ThreadPoolExecutor de amortize overhead round-trip
+        (thay vi goi generate_single_image tung anh mot + sleep co dinh).
+
+        Returns:
+            List (success, token_expired) theo dung thu tu prompts dau vao.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        results = [(False, False)] * len(prompts)
+        with ThreadPoolExecutor(max_workers=min(batch_size, len(prompts))) as pool:
+            futures = {
+                pool.submit(self.generate_single_image, p, profile): i
+                for i, p in enumerate(prompts)
+            }
+            for fut, i in futures.items():
+                try:
+                    results[i] = fut.result()
+                except Exception as e:
+                    self.log(f"[{prompts[i].get('id', '')}] Batch error: {e}", "WARN")
+                    results[i] = (False, False)
+        return results
+
     def generate_images_api(self, prompts: List[Dict], proj_dir: Path) -> Dict:
         """
         Tao anh bang API MODE (nhanh hon, khong can mo browser).
@@ -1756,7 +1887,7 @@ class SmartEngine:
         if self.assigned_profile:
             profile_name = self.assigned_profile
         elif self.profiles:
-            profile_name = Path(self.profiles[0].value).name
+            profile_name = os.path.basename(self.profiles[0].value)
 
         self.log(f"API mode voi profile: {profile_name}")
 
@@ -2189,7 +2320,7 @@ class SmartEngine:
             # Tim profile matching voi profile_name de lay project_id
             matching_profile = None
             for p in self.profiles:
-                if Path(p.value).name == profile_name:
+                if os.path.basename(p.value) == profile_name:
                     matching_profile = p
                     break
 
@@ -2298,56 +2429,97 @@ class SmartEngine:
             if not active_profile:
                 break
 
-            profile_name = Path(active_profile.value).name
+            profile_name = os.path.basename(active_profile.value)
             self.log(f"Dung profile: {profile_name}")
 
-            # Process images sequentially with 1 profile
+            # Process images in BATCHES with 1 profile
             pending = results["pending"]
             results["pending"] = []
             done_count = 0
 
+            # Pre-filter: anh da ton tai thi khong dua vao batch.
+            # 1 lan scandir moi thu muc output -> set ten file co san,
+            # thay cho N lan stat tung anh (rat dat tren network share)
+            existing_cache = {}
+
+            def _existing_names(parent: str) -> frozenset:
+                names = existing_cache.get(parent)
+                if names is None:
+                    try:
+                        with os.scandir(parent) as it:
+                            names = frozenset(e.name for e in it)
+                    except OSError:
+                        names = frozenset()
+                    existing_cache[parent] = names
+                return names
+
+            todo = []
+            skipped = 0
             for prompt_data in pending:
-                if self.stop_flag:
-                    results["pending"].append(prompt_data)
+                output = prompt_data.get('output_path', '')
+                if output and os.path.basename(output) in _existing_names(os.path.dirname(output)):
+                    done_count += 1
+                    results["success"] += 1
+                    skipped += 1
+                else:
+                    todo.append(prompt_data)
+
+            # Log gom theo batch thay vi tung line (it GUI wakeup hon)
+            buf = _LogBuffer(self._emit_raw)
+            if skipped:
+                buf.log(f"[Skip] {skipped} anh da ton tai")
+
+            # Chia batch - KHONG tron nv/loc voi scene trong cung 1 batch
+            # (scene can media_name tu ref da tao xong truoc do)
+            batch_size = 8
+            batches = []
+            cur = []
+            cur_is_ref = None
+            for prompt_data in todo:
+                pid = prompt_data.get('id', '')
+                is_ref = pid.startswith('nv') or pid.startswith('loc')
+                if cur and (len(cur) >= batch_size or is_ref != cur_is_ref):
+                    batches.append(cur)
+                    cur = []
+                cur.append(prompt_data)
+                cur_is_ref = is_ref
+            if cur:
+                batches.append(cur)
+
+            # Token bucket thay cho sleep co dinh: rate tu self.delay
+            # (delay_between_images trong settings.yaml van co tac dung)
+            bucket = _TokenBucket(rate=1.0 / max(self.delay, 0.05), capacity=batch_size)
+
+            for batch in batches:
+                # Token chet / stop -> don not cac batch con lai vao pending
+                if self.stop_flag or not active_profile.token:
+                    results["pending"].extend(batch)
                     continue
 
-                pid = prompt_data.get('id', '')
-                self.log(f"[{pid}] Dang tao...")
-
-                # Check token still valid
-                if not active_profile.token:
-                    self.log(f"[{pid}] Token het han, dung lai!", "WARN")
-                    results["pending"].append(prompt_data)
-                    # Add remaining to pending
-                    idx = pending.index(prompt_data)
-                    results["pending"].extend(pending[idx+1:])
-                    break
+                bucket.consume(len(batch))
+                buf.log(f"[Batch] {len(batch)} anh: {batch[0].get('id', '')}...{batch[-1].get('id', '')}")
 
-                success, token_expired = self.generate_single_image(prompt_data, active_profile)
+                batch_results = self.generate_images_batch(batch, active_profile, batch_size=batch_size)
 
-                if token_expired:
-                    active_profile.token = ""
-                    self.log(f"[{pid}] Token het han!", "WARN")
-                    results["pending"].append(prompt_data)
-                    # Add remaining to pending
-                    idx = pending.index(prompt_data)
-                    results["pending"].extend(pending[idx+1:])
-                    break
+                token_died = False
+                for prompt_data, (success, token_expired) in zip(batch, batch_results):
+                    pid = prompt_data.get('id', '')
+                    if token_expired:
+                        token_died = True
+                    if success:
+                        done_count += 1
+                        results["success"] += 1
+                    else:
+                        buf.log(f"[{pid}] FAIL", "WARN")
+                        results["pending"].append(prompt_data)
 
-                if success:
-                    self.log(f"[{pid}] OK!", "OK")
-                    done_count += 1
-                    results["success"] += 1
-                else:
-                    self.log(f"[{pid}] FAIL", "WARN")
-                    results["pending"].append(prompt_data)
+                if token_died:
+                    active_profile.token = ""
+                    buf.log("Token het han, dung round nay!", "WARN")
 
-                # Small delay
-                time.sleep(self.delay)
+                buf.log(f"[Progress] {done_count}/{len(pending)}")
 
-                # Progress log
-                if done_count % 5 == 0:
-                    self.log(f"[Progress] {done_count}/{len(pending)}")
+            buf.flush()
 
             self.log(f"Round {attempt}: +{done_count} OK, {len(results['pending'])} pending")
 
@@ -4321,7 +4493,7 @@ class SmartEngine:
                         if profile.token and self.is_token_valid(profile):
                             bearer_token = profile.token
                             project_id = profile.project_id or ''
-                            self.log(f"[VIDEO] Dùng token từ profile: {Path(profile.value).name}")
+                            self.log(f"[VIDEO] Dùng token từ profile: {os.path.basename(profile.value)}")
                             break
 
                 # 5. FALLBACK: Token từ settings.yaml
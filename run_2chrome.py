@@ -29,14 +29,42 @@ print(f"""
 {'='*60}
 """)
 
-# Tu dong mo 2 CMD tren Windows
+# Tu dong mo 2 console tren Windows
 if sys.platform == 'win32':
-    print("Dang mo 2 CMD windows...")
-    subprocess.Popen(f'start cmd /k "cd /d {TOOL_DIR} && python _run_chrome1.py"', shell=True)
-    subprocess.Popen(f'start cmd /k "cd /d {TOOL_DIR} && python _run_chrome2.py"', shell=True)
-    print("Done! 2 CMD windows da mo.")
+    # Popen argv list + CREATE_NEW_CONSOLE: moi worker 1 console rieng,
+    # khong qua start/cmd.exe trung gian (it process hon, khong lo quoting)
+    print("Dang mo 2 console windows...")
+    for script in ("_run_chrome1.py", "_run_chrome2.py"):
+        subprocess.Popen(
+            [sys.executable, str(TOOL_DIR / script)],
+            cwd=str(TOOL_DIR),
+            creationflags=subprocess.CREATE_NEW_CONSOLE
+        )
+    print("Done! 2 console windows da mo.")
     print("\nChi can doi - tat ca tu dong!")
 else:
-    print("Tren Linux/Mac, chay thu cong trong 2 terminal:")
-    print(f"  Terminal 1: python {TOOL_DIR}/_run_chrome1.py")
-    print(f"  Terminal 2: python {TOOL_DIR}/_run_chrome2.py")
+    # Linux/Mac: chay 2 worker song song qua executor, cleanup chuan khi Ctrl+C
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    scripts = ["_run_chrome1.py", "_run_chrome2.py"]
+    procs = []
+
+    def run_script(script):
+        proc = subprocess.Popen([sys.executable, str(TOOL_DIR / script)], cwd=str(TOOL_DIR))
+        procs.append(proc)
+        return proc.wait()
+
+    print("Dang chay 2 worker song song...")
+    try:
+        with ThreadPoolExecutor(max_workers=len(scripts)) as ex:
+            futures = {ex.submit(run_script, s): s for s in scripts}
+            for f in as_completed(futures):
+                print(f"  {futures[f]} exited with code {f.result()}")
+    except KeyboardInterrupt:
+        print("\nStopping workers...")
+        for proc in procs:
+            try:
+                proc.terminate()
+                proc.wait(timeout=5)
+            except Exception:
+                proc.kill()
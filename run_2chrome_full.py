@@ -37,12 +37,18 @@ print(f"""
 {'='*60}
 """)
 
-# Tự động mở 2 CMD trên Windows
+# Tự động mở 2 console trên Windows
 if sys.platform == 'win32':
-    print("Đang mở 2 CMD windows...")
-    subprocess.Popen(f'start cmd /k "cd /d {TOOL_DIR} && python _run_chrome1_full.py"', shell=True)
-    subprocess.Popen(f'start cmd /k "cd /d {TOOL_DIR} && python _run_chrome2_full.py"', shell=True)
-    print("Done! 2 CMD windows đã mở.")
+    # Argv list + CREATE_NEW_CONSOLE: không qua start/cmd.exe trung gian
+    # (ít process hơn, không lo cmd.exe parse/quoting)
+    print("Đang mở 2 console windows...")
+    for script in ("_run_chrome1_full.py", "_run_chrome2_full.py"):
+        subprocess.Popen(
+            [sys.executable, str(TOOL_DIR / script)],
+            cwd=str(TOOL_DIR),
+            creationflags=subprocess.CREATE_NEW_CONSOLE
+        )
+    print("Done! 2 console windows đã mở.")
     print("\nChỉ cần đợi - tất cả tự động!")
 else:
     print("Trên Linux/Mac, chạy thủ công trong 2 terminal:")
@@ -29,6 +29,15 @@ if sys.platform == "win32":
     if sys.stderr:
         sys.stderr.reconfigure(encoding='utf-8', errors='replace')
     os.environ['PYTHONIOENCODING'] = 'utf-8'
+    # VM Manager launch worker trực tiếp (không còn qua "start title cmd /k")
+    # nên console không tự có title - tự đặt từ env để hide/show theo title
+    _title = os.environ.get('VE3_CONSOLE_TITLE')
+    if _title:
+        try:
+            import ctypes
+            ctypes.windll.kernel32.SetConsoleTitleW(_title)
+        except Exception:
+            pass
 import time
 import shutil
 import yaml
@@ -27,6 +27,8 @@ if sys.platform == "win32":
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 import time
 import shutil
+import subprocess
+import threading
 from pathlib import Path
 
 # Add current directory to path
@@ -78,6 +80,49 @@ LOCAL_PROJECTS = TOOL_DIR / "PROJECTS"
 # Scan interval (seconds)
 SCAN_INTERVAL = 30
 
+# Event đánh thức scan loop sớm (thay cho time.sleep cố định):
+# set() từ nơi khác (vd: có project mới) → loop phản ứng ngay thay vì đợi hết interval
+_scan_wake = threading.Event()
+
+
+def wake_scan_loop():
+    """Đánh thức run_scan_loop ngay lập tức (gọi khi có project mới)."""
+    _scan_wake.set()
+
+
+def _start_master_watch(watch_dir):
+    """
+    Watch MASTER_PROJECTS bằng watchdog (nếu có cài) - kernel báo khi có
+    file mới → đánh thức scan loop ngay thay vì đợi hết SCAN_INTERVAL.
+
+    watchdog là optional: không có (hoặc UNC path không hỗ trợ notify)
+    thì trả về None, loop vẫn poll 30s như cũ.
+    """
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        return None
+
+    class _WakeHandler(FileSystemEventHandler):
+        def on_created(self, event):
+            wake_scan_loop()
+
+        def on_modified(self, event):
+            wake_scan_loop()
+
+    try:
+        observer = Observer()
+        observer.schedule(_WakeHandler(), str(watch_dir), recursive=False)
+        observer.daemon = True
+        observer.start()
+        print(f"  [OK] Watching for new projects: {watch_dir}")
+        return observer
+    except Exception as e:
+        # ReadDirectoryChangesW/inotify có thể fail trên UNC share → poll fallback
+        print(f"  [WARN] FS watch unavailable ({e}), falling back to {SCAN_INTERVAL}s poll")
+        return None
+
 
 def get_channel_from_folder() -> str:
     """
@@ -116,6 +161,22 @@ def matches_channel(code: str) -> bool:
     return code.startswith(f"{WORKER_CHANNEL}-")
 
 
+def _has_media_files(img_dir: Path) -> bool:
+    """
+    Check nhanh "có file media nào không?" bằng 1 lần os.scandir (early-exit).
+    Nhanh hơn nhiều so với 3 lần glob trên SMB share.
+    """
+    try:
+        with os.scandir(img_dir) as it:
+            return any(
+                e.name.endswith((".png", ".mp4", ".jpg"))
+                and e.is_file(follow_symlinks=False)
+                for e in it
+            )
+    except (OSError, PermissionError):
+        return False
+
+
 def is_project_complete_on_master(code: str) -> bool:
     """Check if project already exists in VISUAL folder on master."""
     # SAFETY: Kiểm tra master có thực sự accessible không
@@ -129,38 +190,82 @@ def is_project_complete_on_master(code: str) -> bool:
         # Master không accessible - return False để giữ local an toàn
         return False
 
-    visual_dir = MASTER_VISUAL / code
-    if not visual_dir.exists():
+    # Check if has ANY images (*.png, *.mp4, *.jpg) - 1 scandir, early-exit.
+    # Không cần exists() trước: thư mục thiếu → scandir raise OSError → False,
+    # đỡ 2 round-trip stat() qua SMB.
+    return _has_media_files(MASTER_VISUAL / code / "img")
+
+
+# === CACHE CHO SCAN LOOP ===
+# Scan loop gọi matches_channel / is_project_complete_on_master cho hàng trăm
+# project mỗi cycle - mỗi lần check master là 1 round-trip SMB.
+# Cache với TTL = SCAN_INTERVAL (key chứa epoch nên entry tự hết hạn).
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _matches_channel_cached(code: str) -> bool:
+    return matches_channel(code)
+
+
+def _scan_epoch() -> int:
+    """Epoch đổi mỗi SCAN_INTERVAL giây → cache entry tự expire."""
+    return int(time.monotonic() // SCAN_INTERVAL)
+
+
+@lru_cache(maxsize=16)
+def _master_visual_codes(_epoch: int) -> frozenset:
+    """
+    1 lần scandir MASTER_VISUAL → set các code đã có folder trên master.
+    Thay cho N lần exists() check riêng lẻ qua SMB.
+    """
+    try:
+        with os.scandir(MASTER_VISUAL) as it:
+            return frozenset(e.name for e in it if e.is_dir(follow_symlinks=False))
+    except (OSError, PermissionError):
+        return frozenset()
+
+
+@lru_cache(maxsize=4096)
+def _is_complete_on_master_cached(code: str, _epoch: int) -> bool:
+    # Bulk pre-filter: không có folder trong VISUAL thì chắc chắn chưa complete
+    if code not in _master_visual_codes(_epoch):
         return False
+    return is_project_complete_on_master(code)
 
-    # Check if has ANY images (*.png, *.mp4, *.jpg)
-    img_dir = visual_dir / "img"
-    if img_dir.exists():
-        try:
-            img_files = list(img_dir.glob("*.png")) + list(img_dir.glob("*.mp4")) + list(img_dir.glob("*.jpg"))
-            return len(img_files) > 0
-        except (OSError, PermissionError):
-            return False
 
-    return False
+# Cache kết quả check Excel theo mtime_ns - scan loop gọi lại mỗi 30s,
+# parse workbook (nhất là qua SMB) rất đắt trong khi file thường không đổi
+_excel_prompts_cache: dict = {}
 
 
 def has_excel_with_prompts(project_dir: Path, name: str) -> bool:
     """Check if project has Excel with prompts (ready for worker)."""
     # Check flat structure
     excel_path = project_dir / f"{name}_prompts.xlsx"
-    if not excel_path.exists():
+    key = str(excel_path)
+    try:
+        mtime = os.stat(key).st_mtime_ns
+    except OSError:
+        _excel_prompts_cache.pop(key, None)
         return False
 
+    cached = _excel_prompts_cache.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
     try:
         from modules.excel_manager import PromptWorkbook
-        wb = PromptWorkbook(str(excel_path))
+        wb = PromptWorkbook(key)
         stats = wb.get_stats()
         total_scenes = stats.get('total_scenes', 0)
         scenes_with_prompts = stats.get('scenes_with_prompts', 0)
-        return total_scenes > 0 and scenes_with_prompts > 0
+        result = total_scenes > 0 and scenes_with_prompts > 0
     except:
-        return False
+        result = False
+
+    _excel_prompts_cache[key] = (mtime, result)
+    return result
 
 
 def needs_api_completion(project_dir: Path, name: str) -> bool:
@@ -439,7 +544,9 @@ def copy_from_master(code: str) -> Path:
         return None
 
     print(f"  [COPY] Copying from master: {code}")
-    shutil.copytree(src, dst)
+    # _fast_copytree: robocopy (Windows) / sendfile song song (POSIX),
+    # skip file trùng size+mtime → copy dở từ lần trước chỉ tốn phần thiếu
+    _fast_copytree(src, dst)
     print(f"  [OK] Copied to: {dst}")
     # Cleanup: delete from master after successful copy
     delete_master_source(code)
@@ -447,6 +554,82 @@ def copy_from_master(code: str) -> Path:
     return dst
 
 
+def _copyfile_fast(src: str, dst: str):
+    """
+    Copy 1 file bằng fast path của OS:
+    - Windows: shutil.copy2 (Python dùng CopyFile2 kernel-level copy).
+    - POSIX: os.sendfile - transfer trong kernel, không qua buffer 16KB userspace.
+    """
+    if os.name == 'nt' or not hasattr(os, 'sendfile'):
+        shutil.copy2(src, dst)
+        return
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        remaining = os.fstat(src_fd).st_size
+        offset = 0
+        while remaining > 0:
+            sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+    shutil.copystat(src, dst)
+
+
+def _fast_copytree(src: Path, dst: Path):
+    """
+    Copy cây thư mục nhanh hơn shutil.copytree (quan trọng với SMB share).
+
+    - Windows: dùng robocopy /MIR /MT:16 (kernel-level, multi-threaded SMB copy,
+      nhanh hơn nhiều lần so với copy từng file 16KB chunk của Python).
+      /MIR mirror luôn nên KHÔNG cần rmtree đích trước.
+    - Linux/Mac: os.walk 1 lần + ThreadPoolExecutor copy song song từng file.
+      File đã có ở đích với cùng size + mtime thì bỏ qua (delta sync) →
+      project đã copy dở chỉ tốn thời gian phần thiếu, không copy lại từ đầu.
+    """
+    if os.name == 'nt':
+        # Robocopy: returncode <= 7 là thành công (convention của robocopy)
+        result = subprocess.run(
+            ["robocopy", str(src), str(dst),
+             "/MIR", "/MT:16", "/NFL", "/NDL", "/NJH", "/NJS", "/R:1", "/W:1"],
+            check=False
+        )
+        if result.returncode > 7:
+            raise OSError(f"robocopy failed with code {result.returncode}")
+        return
+
+    # Non-Windows fallback: tạo thư mục tuần tự, copy file song song
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _needs_copy(src_file: str, dst_file: str) -> bool:
+        """File chưa có ở đích, hoặc size/mtime khác → cần copy."""
+        try:
+            src_st = os.stat(src_file)
+            dst_st = os.stat(dst_file)
+        except OSError:
+            return True
+        return (src_st.st_size != dst_st.st_size
+                or src_st.st_mtime_ns != dst_st.st_mtime_ns)
+
+    copy_jobs = []
+    for root, dirs, files in os.walk(src):
+        rel = os.path.relpath(root, src)
+        dst_dir = dst if rel == '.' else dst / rel
+        os.makedirs(dst_dir, exist_ok=True)
+        for fname in files:
+            src_file = os.path.join(root, fname)
+            dst_file = os.path.join(str(dst_dir), fname)
+            if _needs_copy(src_file, dst_file):
+                copy_jobs.append((src_file, dst_file))
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        futures = [pool.submit(_copyfile_fast, s, d) for s, d in copy_jobs]
+        for fut in futures:
+            fut.result()  # Re-raise lỗi copy (nếu có)
+
+
 def copy_to_visual(code: str, local_dir: Path) -> bool:
     """Copy completed project to VISUAL folder on master."""
     dst = MASTER_VISUAL / code
@@ -457,11 +640,10 @@ def copy_to_visual(code: str, local_dir: Path) -> bool:
         # Create VISUAL dir on master
         MASTER_VISUAL.mkdir(parents=True, exist_ok=True)
 
-        if dst.exists():
-            shutil.rmtree(dst)
-
-        # Copy entire project folder
-        shutil.copytree(local_dir, dst)
+        # Không rmtree đích nữa: _fast_copytree delta-sync tại chỗ
+        # (robocopy /MIR trên Windows, so size/mtime trên Linux/Mac)
+        # → đích đã có phần lớn file thì chỉ copy phần thiếu.
+        _fast_copytree(local_dir, dst)
         print(f"  [OK] Copied to: {dst}")
 
         # Cleanup: delete local project after successful copy
@@ -483,14 +665,22 @@ def is_local_complete(project_dir: Path, name: str) -> bool:
     3. Nếu video_count > 0: phải có đủ video tương ứng
     """
     img_dir = project_dir / "img"
-    if not img_dir.exists():
-        return False
 
-    # Count images (png, jpg) - exclude videos
-    img_files = list(img_dir.glob("*.png")) + list(img_dir.glob("*.jpg"))
-
-    # Count videos
-    video_files = list(img_dir.glob("*.mp4"))
+    # Count images (png, jpg) và videos trong 1 lần scandir thay vì 3 lần glob
+    # (không exists() trước - scandir fail thì coi như chưa có ảnh)
+    img_files = []
+    video_files = []
+    try:
+        with os.scandir(img_dir) as it:
+            for e in it:
+                if not e.is_file(follow_symlinks=False):
+                    continue
+                if e.name.endswith((".png", ".jpg")):
+                    img_files.append(e.name)
+                elif e.name.endswith(".mp4"):
+                    video_files.append(e.name)
+    except (OSError, PermissionError):
+        return False
 
     # Cần ít nhất 1 file ảnh
     if len(img_files) == 0:
@@ -650,24 +840,30 @@ def scan_incomplete_local_projects() -> list:
     if not LOCAL_PROJECTS.exists():
         return need_processing
 
-    for item in LOCAL_PROJECTS.iterdir():
-        if not item.is_dir():
-            continue
+    # os.scandir: is_dir() dùng luôn dirent info, không tốn thêm stat() mỗi entry
+    with os.scandir(LOCAL_PROJECTS) as it:
+        entries = [e.name for e in it if e.is_dir(follow_symlinks=False)]
 
-        code = item.name
+    epoch = _scan_epoch()
+    # Build path con bằng string concat - khỏi construct Path object mỗi vòng
+    local_base = os.fspath(LOCAL_PROJECTS)
+
+    for code in entries:
+        item = LOCAL_PROJECTS / code
 
         # Skip if not matching channel
-        if not matches_channel(code):
+        if not _matches_channel_cached(code):
             continue
 
         # Skip if already in VISUAL (đã hoàn thành)
-        if is_project_complete_on_master(code):
+        if _is_complete_on_master_cached(code, epoch):
             continue
 
         # Check if has Excel with prompts OR has SRT (can create Excel)
-        srt_path = item / f"{code}.srt"
+        # String concat thay vì Path.__truediv__ trong hot loop
+        item_base = local_base + os.sep + code
         has_excel = has_excel_with_prompts(item, code)
-        has_srt = srt_path.exists()
+        has_srt = os.path.isfile(item_base + os.sep + code + ".srt")
 
         if not has_excel and not has_srt:
             continue  # Không có gì để xử lý
@@ -717,8 +913,12 @@ def safe_iterdir(path: Path) -> list:
         return []
 
 
-def scan_master_projects() -> list:
-    """Scan master PROJECTS folder for pending projects."""
+def scan_master_projects(skip_codes: set = None) -> list:
+    """Scan master PROJECTS folder for pending projects.
+
+    skip_codes: các code đã pending từ local scan - skip sớm để khỏi tốn
+    thêm round-trip SMB check lại.
+    """
     pending = []
 
     print(f"  [DEBUG] Checking: {MASTER_PROJECTS}")
@@ -742,33 +942,40 @@ def scan_master_projects() -> list:
         print(f"  [WARN] Network error listing master: {e}")
         return pending
 
+    epoch = _scan_epoch()
+
     for item in all_folders:
         try:
             code = item.name
 
+            # Skip if already pending from local scan (O(1) set lookup)
+            if skip_codes and code in skip_codes:
+                continue
+
             # Skip if not matching this worker's channel
-            if not matches_channel(code):
+            if not _matches_channel_cached(code):
                 continue  # Silent skip - not our channel
 
             # Skip if already in VISUAL
-            if is_project_complete_on_master(code):
+            if _is_complete_on_master_cached(code, epoch):
                 print(f"    - {code}: already in VISUAL [v]")
                 continue
 
-            # Check if has Excel or SRT
-            excel_path = item / f"{code}_prompts.xlsx"
-            srt_path = item / f"{code}.srt"
+            # Check if has Excel or SRT (string paths - tránh Path alloc mỗi entry)
+            item_base = os.fspath(item)
+            excel_path = item_base + os.sep + code + "_prompts.xlsx"
+            srt_path = item_base + os.sep + code + ".srt"
 
             # Wrap network path checks in try-except
             try:
                 if has_excel_with_prompts(item, code):
                     print(f"    - {code}: ready (has prompts) [v]")
                     pending.append(code)
-                elif srt_path.exists():
+                elif os.path.isfile(srt_path):
                     # Có SRT nhưng không có Excel - worker sẽ tự tạo
                     print(f"    - {code}: has SRT, no Excel → will create with API")
                     pending.append(code)
-                elif excel_path.exists():
+                elif os.path.isfile(excel_path):
                     print(f"    - {code}: Excel exists but no prompts yet")
                 else:
                     print(f"    - {code}: no Excel and no SRT")
@@ -784,6 +991,17 @@ def scan_master_projects() -> list:
     return sorted(pending)
 
 
+def scan_pending_projects() -> list:
+    """
+    Gộp 2 lượt scan (local + master) thành 1 danh sách pending, dedupe bằng
+    dict keyed by code. Master scan skip các code đã pending từ local.
+    """
+    local = scan_incomplete_local_projects()
+    pending = dict.fromkeys(local)
+    pending.update(dict.fromkeys(scan_master_projects(skip_codes=set(local))))
+    return sorted(pending)
+
+
 def sync_local_to_visual() -> int:
     """
     Scan local PROJECTS và CLEANUP các project đã sync.
@@ -819,27 +1037,43 @@ def sync_local_to_visual() -> int:
 
     cleaned = 0
 
-    for item in all_folders:
+    def check_one(item: Path) -> str:
+        """Check 1 project (chạy trong thread pool - mỗi check là SMB I/O độc lập)."""
         code = item.name
 
-        # Skip if not matching this worker's channel
-        if not matches_channel(code):
-            continue  # Silent skip - not our channel
-
         # Nếu đã có trong VISUAL thì xóa local (cleanup)
         if is_project_complete_on_master(code):
-            print(f"    - {code}: already in VISUAL, cleaning up local...")
             delete_local_project(code)
-            cleaned += 1
-            continue
+            return "cleaned"
 
         # KHÔNG copy sang VISUAL ở đây!
         # Để scan_incomplete_local_projects() và process_project() xử lý
         # Engine sẽ chạy và hoàn thành project trước khi sync
         if is_local_complete(item, code):
-            print(f"    - {code}: has images, will process via engine")
-        else:
-            print(f"    - {code}: incomplete, will process via engine")
+            return "has_images"
+        return "incomplete"
+
+    # Mỗi project là 1 round-trip SMB độc lập → chạy song song để overlap latency
+    targets = [item for item in all_folders if matches_channel(item.name)]
+    if targets:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=min(8, len(targets))) as ex:
+            futures = {ex.submit(check_one, item): item.name for item in targets}
+            for f in as_completed(futures):
+                code = futures[f]
+                try:
+                    result = f.result()
+                except (OSError, PermissionError) as e:
+                    print(f"    - {code}: check error: {e}")
+                    continue
+                if result == "cleaned":
+                    print(f"    - {code}: already in VISUAL, cleaned up local")
+                    cleaned += 1
+                elif result == "has_images":
+                    print(f"    - {code}: has images, will process via engine")
+                else:
+                    print(f"    - {code}: incomplete, will process via engine")
 
     if cleaned > 0:
         print(f"  Cleaned up {cleaned} projects already in VISUAL")
@@ -891,6 +1125,11 @@ def run_scan_loop():
         print(f"\n   Press Ctrl+C to exit and fix the connection.")
         print(f"   Will retry every {SCAN_INTERVAL}s...")
 
+    # FS watch (nếu có watchdog): project mới xuất hiện → scan ngay,
+    # không thì vẫn đợi tối đa SCAN_INTERVAL như cũ
+    if AUTO_PATH and safe_path_exists(MASTER_PROJECTS):
+        _start_master_watch(MASTER_PROJECTS)
+
     # === SYNC: Copy local projects đã có ảnh sang VISUAL ===
     print(f"\n[SYNC] Checking local projects to sync to VISUAL...")
     synced = sync_local_to_visual()
@@ -910,21 +1149,16 @@ def run_scan_loop():
         if synced > 0:
             print(f"  [OUT] Synced {synced} local projects to VISUAL")
 
-        # Find incomplete local projects (đã copy về nhưng chưa xong)
-        incomplete_local = scan_incomplete_local_projects()
-
-        # Find pending projects from master
-        pending_master = scan_master_projects()
-
-        # Merge: incomplete local + pending master (loại bỏ duplicate)
-        pending = list(dict.fromkeys(incomplete_local + pending_master))
+        # Merged scan: incomplete local + pending master (dedupe by code)
+        pending = scan_pending_projects()
 
         if not pending:
             print(f"  No pending projects")
             # Wait before next scan
             print(f"\n  Waiting {SCAN_INTERVAL}s... (Ctrl+C to stop)")
             try:
-                time.sleep(SCAN_INTERVAL)
+                if _scan_wake.wait(SCAN_INTERVAL):
+                    _scan_wake.clear()
             except KeyboardInterrupt:
                 print("\n\nStopped by user.")
                 break
@@ -958,7 +1192,8 @@ def run_scan_loop():
             print(f"\n  [OK] Processed all pending projects!")
             print(f"  Waiting {SCAN_INTERVAL}s for new projects... (Ctrl+C to stop)")
             try:
-                time.sleep(SCAN_INTERVAL)
+                if _scan_wake.wait(SCAN_INTERVAL):
+                    _scan_wake.clear()
             except KeyboardInterrupt:
                 print("\n\nStopped by user.")
                 break
@@ -992,19 +1227,75 @@ def run_parallel_mode(project: str = None):
     video_cmd.extend(["--worker-id", str(WORKER_ID), "--total-workers", str(TOTAL_WORKERS)])
 
     print(f"\n[PARALLEL] Starting VIDEO worker in background...")
+    # Binary pipe, unbuffered: tránh text-mode decode từng dòng trong reader
     video_process = subprocess.Popen(
         video_cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
+        bufsize=0
     )
 
     # Thread to print VIDEO output
     def print_video_output():
         try:
-            for line in video_process.stdout:
-                print(f"[VIDEO] {line.rstrip()}")
+            if sys.platform == "win32":
+                # Windows: select() không hỗ trợ pipe → vẫn đọc blocking,
+                # nhưng theo chunk lớn thay vì readline từng dòng: 1 syscall
+                # lấy cả khối output rồi split 1 lần, phần dư sau b'\n' cuối
+                # giữ lại cho chunk sau (giống nhánh Linux)
+                # Gom cả batch thành 1 str rồi 1 lần write+flush thay vì
+                # print từng dòng (mỗi print = lock TextIOWrapper + flush).
+                # Decode 1 lần cho cả chunk (incremental decoder giữ multibyte
+                # char bị cắt giữa 2 chunk) thay vì decode từng dòng.
+                import codecs
+                decode = codecs.getincrementaldecoder('utf-8')('replace').decode
+                read = video_process.stdout.read
+                write = sys.stdout.write
+                residual = ""
+                while True:
+                    chunk = read(65536)
+                    if not chunk:
+                        break
+                    lines = (residual + decode(chunk)).split("\n")
+                    residual = lines.pop()
+                    if lines:
+                        write("".join(f"[VIDEO] {line.rstrip()}\n" for line in lines))
+                        sys.stdout.flush()
+                if residual:
+                    print(f"[VIDEO] {residual}")
+            else:
+                # Linux/Mac: selectors multiplexing - không block trên readline,
+                # latency giới hạn bởi kernel pipe wakeup thay vì sleep/poll
+                import selectors
+                sel = selectors.DefaultSelector()
+                fd = video_process.stdout.fileno()
+                os.set_blocking(fd, False)
+                sel.register(video_process.stdout, selectors.EVENT_READ, data="[VIDEO]")
+
+                # Residual buffer: os.read có thể cắt giữa dòng, giữ phần dư
+                # lại cho chunk sau. Decode 1 lần cho cả chunk (incremental
+                # decoder giữ multibyte char bị cắt giữa 2 chunk) rồi mới split.
+                import codecs
+                decode = codecs.getincrementaldecoder('utf-8')('replace').decode
+                residual = ""
+                write = sys.stdout.write
+                while sel.get_map():
+                    for key, _ in sel.select(timeout=0.5):
+                        chunk = os.read(fd, 65536)
+                        if not chunk:
+                            if residual:
+                                print(f"{key.data} {residual}")
+                                residual = ""
+                            sel.unregister(key.fileobj)
+                            continue
+                        lines = (residual + decode(chunk)).split("\n")
+                        residual = lines.pop()  # Phần sau '\n' cuối (có thể rỗng)
+                        if lines:
+                            # 1 write + 1 flush cho cả batch thay vì print từng dòng
+                            write("".join(
+                                f"{key.data} {line}\n" for line in lines
+                            ))
+                            sys.stdout.flush()
         except:
             pass
 
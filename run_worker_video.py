@@ -56,6 +56,18 @@ VIDEO_COUNT = -1  # -1 = full (all images)
 VIDEO_SCAN_INTERVAL = 5  # Scan nhanh hơn để bắt kịp ảnh mới
 
 
+def _scandir_names(directory: Path, suffix: str) -> frozenset:
+    """1 lần scandir → set tên file theo suffix. Thay cho N lần Path.exists()."""
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(
+                e.name for e in it
+                if e.name.endswith(suffix) and e.is_file(follow_symlinks=False)
+            )
+    except (OSError, PermissionError):
+        return frozenset()
+
+
 def get_scenes_with_images(project_dir: Path, name: str) -> list:
     """Get list of scenes that have images but no videos yet."""
     img_dir = project_dir / "img"
@@ -75,6 +87,9 @@ def get_scenes_with_images(project_dir: Path, name: str) -> list:
         scenes = wb.get_scenes()
         scene_media_ids = wb.get_scene_media_ids()
 
+        # 1 lần scandir thay vì stat() từng video (mỗi stat là 1 RTT trên SMB)
+        existing_videos = _scandir_names(img_dir, ".mp4")
+
         for scene in scenes:
             scene_id = str(scene.scene_id)
 
@@ -84,8 +99,7 @@ def get_scenes_with_images(project_dir: Path, name: str) -> list:
                 continue
 
             # Check đã có video chưa
-            video_path = img_dir / f"{scene_id}.mp4"
-            if video_path.exists():
+            if f"{scene_id}.mp4" in existing_videos:
                 continue
 
             # Có media_id + chưa có video → cần tạo
@@ -106,7 +120,8 @@ def count_videos(project_dir: Path) -> int:
     img_dir = project_dir / "img"
     if not img_dir.exists():
         return 0
-    return len(list(img_dir.glob("*.mp4")))
+    # scandir đếm trực tiếp, không materialize list Path như glob
+    return len(_scandir_names(img_dir, ".mp4"))
 
 
 def process_project_video(code: str, video_count: int = -1, callback=None) -> bool:
@@ -373,11 +388,12 @@ def scan_projects_need_video() -> list:
     if not LOCAL_PROJECTS.exists():
         return projects_need_video
 
-    for item in LOCAL_PROJECTS.iterdir():
-        if not item.is_dir():
-            continue
+    # scandir: is_dir() dùng dirent cache, không tốn thêm stat() mỗi entry
+    with os.scandir(LOCAL_PROJECTS) as it:
+        codes = sorted(e.name for e in it if e.is_dir(follow_symlinks=False))
 
-        code = item.name
+    for code in codes:
+        item = LOCAL_PROJECTS / code
 
         if not matches_channel(code):
             continue
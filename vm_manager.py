@@ -26,10 +26,15 @@ if sys.platform == "win32":
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 import time
 import json
+import random
+import functools
+import signal
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import shutil
 import yaml
 from pathlib import Path
+from collections import Counter, deque
 from datetime import datetime
 from typing import Dict, Optional, List, Set, Any
 from dataclasses import dataclass, field, asdict
@@ -50,6 +55,13 @@ try:
 except ImportError:
     IPV6_MANAGER_ENABLED = False
 
+# psutil (optional) - enumerate/wait process khi kill Chrome
+try:
+    import psutil
+    PSUTIL_ENABLED = True
+except ImportError:
+    PSUTIL_ENABLED = False
+
 TOOL_DIR = Path(__file__).parent
 AGENT_DIR = TOOL_DIR / ".agent"
 TASKS_DIR = AGENT_DIR / "tasks"
@@ -57,6 +69,65 @@ RESULTS_DIR = AGENT_DIR / "results"
 STATUS_DIR = AGENT_DIR / "status"
 LOGS_DIR = AGENT_DIR / "logs"
 CONFIG_FILE = TOOL_DIR / "config" / "settings.yaml"
+AUTO_PATH_CACHE = TOOL_DIR / ".auto_path_cache"
+AUTO_PATH_CACHE_TTL = 86400  # 1 ngày
+
+# check_and_auto_recover quét log liên tục: compile 1 lần thành alternation
+# thay vì 3 lần .lower() + substring cho mỗi dòng log
+_CONN_ERROR_RE = re.compile(r"connection.*(?:disconnected|lost)", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=32)
+def _worker_script(worker_type: str, worker_num: int) -> Path:
+    """Script path cho worker - thuần theo (type, num), cache thay vì dựng
+    Path mới mỗi lần start_worker (restart storm gọi hàng chục lần/phút)."""
+    if worker_type == "excel":
+        return TOOL_DIR / "run_excel_api.py"
+    if worker_num <= 2:
+        return TOOL_DIR / f"_run_chrome{worker_num}.py"
+    # Worker 3+ có role giống worker 2: dùng chung script, WORKER_ID truyền
+    # qua env lúc launch - khỏi clone _run_chromeN.py per worker và N worker
+    # share luôn 1 bản pyc trong page cache. Bản generate cũ (nếu có) vẫn ưu tiên.
+    legacy = TOOL_DIR / f"_run_chrome{worker_num}.py"
+    if legacy.exists():
+        return legacy
+    return TOOL_DIR / "_run_chrome2.py"
+
+
+@functools.lru_cache(maxsize=1)
+def _channel_from_folder() -> Optional[str]:
+    """Channel suy từ tên folder cha - bất biến trong suốt process."""
+    folder = TOOL_DIR.parent.name
+    if "-T" in folder:
+        return folder.split("-T")[0]
+    return None
+
+
+if sys.platform == "win32":
+    import ctypes as _ctypes
+    _GetFileAttributesW = _ctypes.windll.kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [_ctypes.c_wchar_p]
+    _GetFileAttributesW.restype = _ctypes.c_uint32
+
+    def _fast_exists(p: Path) -> bool:
+        # GetFileAttributesW chỉ hỏi attributes, không CreateFileW mở path
+        # như Path.exists() - UNC share offline fail nhanh hơn nhiều
+        return _GetFileAttributesW(str(p)) != 0xFFFFFFFF
+else:
+    def _fast_exists(p: Path) -> bool:
+        return p.exists()
+
+
+# Cache timestamp theo độ phân giải giây: log dày đặc thì khỏi tốn
+# gettimeofday + datetime alloc + strftime cho từng dòng
+_ts_cache = [0, ""]
+
+
+def _log_timestamp() -> str:
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache[0] = sec
+        _ts_cache[1] = time.strftime("%H:%M:%S", time.localtime(sec))
+    return _ts_cache[1]
 
 # ================================================================================
 # ENUMS & DATA STRUCTURES
@@ -91,7 +162,14 @@ class QualityStatus(Enum):
     PARTIAL = "partial"
 
 
-@dataclass
+# slots=True: bỏ __dict__ per-instance (~300B/object), attribute access
+# qua slot descriptor nhanh hơn - manager giữ hàng trăm Task lịch sử.
+# dataclass(slots=...) chỉ có từ 3.10; tool vẫn hỗ trợ 3.8 (README) nên
+# bản cũ chạy không slots như trước
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Task:
     task_id: str
     task_type: TaskType
@@ -114,7 +192,7 @@ class Task:
         return d
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WorkerInfo:
     worker_id: str
     worker_type: str
@@ -122,12 +200,133 @@ class WorkerInfo:
     process: Optional[subprocess.Popen] = None
     status: WorkerStatus = WorkerStatus.STOPPED
     current_task: Optional[str] = None
-    start_time: Optional[datetime] = None
+    # Mốc time.monotonic() lúc start - uptime chỉ cần trừ số, không phải
+    # cấp phát datetime delta mỗi lần render dashboard
+    start_mono: float = 0.0
     completed_tasks: int = 0
     failed_tasks: int = 0
     last_error: str = ""
     last_restart_time: Optional[datetime] = None  # Để track restart cooldown
     restart_count: int = 0  # Số lần restart trong session
+    # Mốc monotonic của các lần restart gần nhất - để backoff/storm cap
+    restart_times: Any = field(default_factory=lambda: deque(maxlen=10))
+    _log_handle: Optional[Any] = None  # File handle log khi chạy hidden mode
+
+
+# os.waitstatus_to_exitcode chỉ có từ 3.9 - bản 3.8 tự dịch wait status
+# theo đúng quy ước đó (exit code, hoặc -signal nếu bị kill)
+if hasattr(os, 'waitstatus_to_exitcode'):
+    _waitstatus_to_exitcode = os.waitstatus_to_exitcode
+else:
+    def _waitstatus_to_exitcode(status: int) -> int:
+        if os.WIFEXITED(status):
+            return os.WEXITSTATUS(status)
+        if os.WIFSIGNALED(status):
+            return -os.WTERMSIG(status)
+        return -1
+
+
+class _SpawnedProcess:
+    """
+    Wrapper tối giản quanh os.posix_spawn (Linux).
+
+    subprocess.Popen đi đường fork+exec: parent càng ngốn RAM thì setup
+    page-table copy-on-write lúc fork càng đắt - restart storm spawn
+    liên tục thì chi phí này cộng dồn. posix_spawn dùng vfork/CLONE_VM
+    nên bỏ qua hẳn bước đó. Chỉ expose đúng phần API Popen mà manager
+    dùng: pid / poll / wait / terminate / kill.
+    """
+
+    __slots__ = ("pid", "returncode")
+
+    def __init__(self, argv: List[str], env: Dict[str, str]):
+        self.pid = os.posix_spawn(argv[0], argv, env, setsid=True)
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                self.returncode = 0  # Đã bị reap nơi khác
+                return self.returncode
+            if pid == self.pid:
+                self.returncode = _waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self, timeout: float = None) -> int:
+        if self.returncode is not None:
+            return self.returncode
+        if timeout is None:
+            _, status = os.waitpid(self.pid, 0)
+            self.returncode = _waitstatus_to_exitcode(status)
+            return self.returncode
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.poll() is not None:
+                return self.returncode
+            time.sleep(0.05)
+        raise subprocess.TimeoutExpired(cmd=f"pid {self.pid}", timeout=timeout)
+
+    def terminate(self):
+        self._send(signal.SIGTERM)
+
+    def kill(self):
+        self._send(signal.SIGKILL)
+
+    def _send(self, sig: int):
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+
+class TaskPool:
+    """
+    Free-list tái dùng Task objects.
+
+    Mỗi project/stage (× retry) tạo 1 Task; chạy cả ca thì hàng nghìn object
+    terminal nằm mãi trong self.tasks và bị quality-check lặp lại mỗi cycle.
+    Task xong hẳn thì release về đây, create_task lấy lại thay vì cấp mới.
+    """
+
+    MAX_FREE = 256
+    _free: List["Task"] = []
+
+    @classmethod
+    def acquire(cls, task_id: str, task_type: TaskType, project_code: str,
+                scenes: List[int] = None, created_at: str = "") -> "Task":
+        # created_at truyền từ ngoài vào để caller tái dùng 1 lần datetime.now()
+        # cho cả task_id lẫn timestamp (đỡ 1 clock_gettime + 1 datetime alloc)
+        if not cls._free:
+            return Task(
+                task_id=task_id,
+                task_type=task_type,
+                project_code=project_code,
+                scenes=scenes or [],
+                created_at=created_at or datetime.now().isoformat(),
+            )
+        t = cls._free.pop()
+        t.task_id = task_id
+        t.task_type = task_type
+        t.project_code = project_code
+        t.scenes = scenes or []
+        t.status = TaskStatus.PENDING
+        t.assigned_to = None
+        t.created_at = created_at or datetime.now().isoformat()
+        t.assigned_at = ""
+        t.completed_at = ""
+        t.result = {}
+        t.error = ""
+        t.retry_count = 0
+        t.max_retries = 3
+        return t
+
+    @classmethod
+    def release(cls, t: "Task"):
+        if len(cls._free) < cls.MAX_FREE:
+            cls._free.append(t)
 
 
 @dataclass
@@ -466,10 +665,13 @@ class QualityChecker:
                     srt_start = seg1.get('srt_range_start', 1)
                     srt_end = seg1.get('srt_range_end', 0)
 
-                    for scene in scenes:
-                        # Scene belongs to Segment 1 if its scene_id is within SRT range
-                        if srt_start <= scene.scene_id <= srt_end:
-                            status.segment1_scenes.append(scene.scene_id)
+                    # Sort scene_ids 1 lần rồi lấy slice bằng bisect
+                    # thay vì so sánh range từng scene
+                    from bisect import bisect_left, bisect_right
+                    scene_ids = sorted(s.scene_id for s in scenes)
+                    lo = bisect_left(scene_ids, srt_start)
+                    hi = bisect_right(scene_ids, srt_end)
+                    status.segment1_scenes.extend(scene_ids[lo:hi])
             except:
                 pass
 
@@ -596,6 +798,25 @@ class QualityChecker:
 # DASHBOARD
 # ================================================================================
 
+# Render được gọi mỗi lần refresh/status: hoist các map hằng ra module
+# thay vì dựng dict literal mới trong từng call
+_WORKER_EMOJI = {
+    "stopped": "[STOP]️ ",
+    "idle": "[IDLE]",
+    "working": "[RUN]",
+    "error": "[FAIL]"
+}
+_EXCEL_EMOJI = {
+    "none": "[FAIL]",
+    "empty": "[FAIL]",
+    "fallback": "[WARN]",
+    "partial": "[WARN]",
+    "complete": "[OK]"
+}
+_STEP_EMOJI = {"excel": "[LIST]", "image": "[IMG]", "video": "[VIDEO]", "done": "[OK]"}
+_LOG_LEVEL_EMOJI = {"INFO": "  ", "WARN": "[WARN]", "ERROR": "[FAIL]", "SUCCESS": "[OK]", "TASK": "[LIST]"}
+
+
 class Dashboard:
     """Giao diện Dashboard để giám sát hệ thống."""
 
@@ -668,12 +889,7 @@ class Dashboard:
         lines = ["║  WORKERS:                                                                 ║"]
 
         for wid, w in self.manager.workers.items():
-            emoji = {
-                "stopped": "[STOP]️ ",
-                "idle": "[IDLE]",
-                "working": "[RUN]",
-                "error": "[FAIL]"
-            }.get(w.status.value, "[?]")
+            emoji = _WORKER_EMOJI.get(w.status.value, "[?]")
 
             # Get detailed info from Agent Protocol if available
             details = self.manager.get_worker_details(wid)
@@ -698,8 +914,8 @@ class Dashboard:
             if details and details.get("uptime_seconds"):
                 mins = details["uptime_seconds"] // 60
                 uptime = f"({mins}m)"
-            elif w.start_time:
-                mins = int((datetime.now() - w.start_time).total_seconds() // 60)
+            elif w.start_mono:
+                mins = int((time.monotonic() - w.start_mono) // 60)
                 uptime = f"({mins}m)"
 
             line = f"║    {emoji} {wid:<12} {w.status.value:<8} done:{w.completed_tasks:<3} fail:{w.failed_tasks:<3} {uptime:<6} {progress_info} {task_info}"
@@ -719,19 +935,13 @@ class Dashboard:
                 status = self.manager.quality_checker.get_project_status(code)
 
                 # Excel status
-                excel_emoji = {
-                    "none": "[FAIL]",
-                    "empty": "[FAIL]",
-                    "fallback": "[WARN]",
-                    "partial": "[WARN]",
-                    "complete": "[OK]"
-                }.get(status.excel_status, "[?]")
+                excel_emoji = _EXCEL_EMOJI.get(status.excel_status, "[?]")
 
                 # Progress
                 img_pct = (status.images_done / status.total_scenes * 100) if status.total_scenes else 0
                 vid_pct = (status.videos_done / status.total_scenes * 100) if status.total_scenes else 0
 
-                step_emoji = {"excel": "[LIST]", "image": "[IMG]", "video": "[VIDEO]", "done": "[OK]"}.get(status.current_step, "[?]")
+                step_emoji = _STEP_EMOJI.get(status.current_step, "[?]")
 
                 line = (
                     f"║    {code:<12} │ "
@@ -749,10 +959,13 @@ class Dashboard:
         return lines
 
     def _render_tasks(self) -> List[str]:
-        pending = len([t for t in self.manager.tasks.values() if t.status in (TaskStatus.PENDING, TaskStatus.RETRY)])
-        running = len([t for t in self.manager.tasks.values() if t.status in (TaskStatus.ASSIGNED, TaskStatus.RUNNING)])
-        completed = len([t for t in self.manager.tasks.values() if t.status == TaskStatus.COMPLETED])
-        failed = len([t for t in self.manager.tasks.values() if t.status == TaskStatus.FAILED])
+        # 1 lượt đếm theo status thay vì 4 list comprehension quét lại
+        # toàn bộ tasks (dashboard refresh mỗi giây)
+        counts = Counter(t.status for t in self.manager.tasks.values())
+        pending = counts[TaskStatus.PENDING] + counts[TaskStatus.RETRY]
+        running = counts[TaskStatus.ASSIGNED] + counts[TaskStatus.RUNNING]
+        completed = counts[TaskStatus.COMPLETED]
+        failed = counts[TaskStatus.FAILED]
 
         return [
             "║  TASKS:                                                                   ║",
@@ -842,10 +1055,76 @@ class VMManager:
         self.dashboard = Dashboard(self)
 
         # Control
+        # Không giữ lock toàn cục: self.tasks/self.workers chỉ mutate từ
+        # orchestrate thread, phần shared thật sự (pidfd map) có lock riêng
         self._stop_flag = False
-        self._lock = threading.Lock()
         self.gui_mode = False  # Track if workers run in GUI mode (minimized CMD)
 
+        # Exit monitor (Linux): 1 thread + epoll trên pidfd của mọi worker
+        # → phát hiện worker chết ngay (kernel wakeup) thay vì đợi
+        # status-file timeout 60s của health check
+        self._exit_epoll = None
+        self._exit_mon_thread = None
+        self._pidfd_map: Dict[int, str] = {}
+        self._exit_mon_lock = threading.Lock()
+
+        # Dedup restart: lỗi thường tới theo burst (cùng 1 crash lặp lại
+        # nhiều dòng log) - worker đã có restart đang chờ thì không queue thêm
+        self._restart_pending: set = set()
+        self._restart_lock = threading.Lock()
+
+        # Script đã stat() thấy tồn tại - khỏi stat lại mỗi lần (re)start
+        self._script_ok: Dict[str, bool] = {}
+
+        # Notify pipe: exit monitor báo run_interactive (select trên stdin
+        # + pipe) khi worker đổi trạng thái - console thấy ngay, không cần
+        # user gõ status
+        self._notify_r = self._notify_w = None
+        if sys.platform != "win32":
+            self._notify_r, self._notify_w = os.pipe()
+            os.set_blocking(self._notify_r, False)
+            os.set_blocking(self._notify_w, False)
+
+        # SIGCHLD + set_wakeup_fd: kernel ghi 1 byte vào pipe ngay khi BẤT KỲ
+        # child nào chết → epoll loop tỉnh dậy tức thì, kể cả với worker
+        # không mở được pidfd (kernel cũ). Chỉ cài được từ main thread -
+        # ValueError thì bỏ qua, epoll pidfd vẫn lo phần chính. Chỉ cài khi
+        # có select.epoll (Linux): wakeup fd mà không có monitor hút thì pipe
+        # 64KB đầy và mỗi SIGCHLD spam stderr "Exception ignored when trying
+        # to write to the signal wakeup fd".
+        self._sigchld_r = None
+        if sys.platform != 'win32' and hasattr(signal, 'SIGCHLD'):
+            import select
+            if hasattr(select, 'epoll'):
+                try:
+                    r, w = os.pipe()
+                    os.set_blocking(r, False)
+                    os.set_blocking(w, False)
+                    signal.set_wakeup_fd(w)
+                    signal.signal(signal.SIGCHLD, lambda *_: None)
+                    self._sigchld_r = r
+                except (ValueError, OSError):
+                    self._sigchld_r = None
+        if self._sigchld_r is not None:
+            # Dựng epoll + thread monitor ngay từ đầu để pipe luôn có người
+            # hút, kể cả khi không worker nào đăng ký được pidfd
+            import select
+            self._exit_epoll = select.epoll()
+            self._exit_epoll.register(self._sigchld_r, select.EPOLLIN)
+            self._exit_mon_thread = threading.Thread(
+                target=self._exit_monitor_loop, daemon=True)
+            self._exit_mon_thread.start()
+
+        # Executor bounded cho việc nền (restart/recovery): không spawn
+        # thread ad-hoc mỗi lần lỗi, và orchestrate loop không bị block
+        # bởi chuỗi kill/sleep/start nhiều giây của handle_worker_error
+        self._bg_exec = ThreadPoolExecutor(max_workers=2, thread_name_prefix="vmmgr")
+
+        # Prewarm bytecode của worker scripts + modules/ trong nền: lần
+        # start/restart đầu tiên không phải trả thêm parse+compile các file
+        # lớn (drission_flow_api ~6k dòng), interpreter mới chỉ load .pyc
+        self._bg_exec.submit(self._prewarm_bytecode)
+
         # IPv6 Manager for rotation
         if IPV6_MANAGER_ENABLED:
             self.ipv6_manager = get_ipv6_manager()
@@ -853,6 +1132,9 @@ class VMManager:
             self.ipv6_manager = None
 
         # Error tracking for intelligent restart/IPv6 rotation
+        # handle_worker_error chạy trên bg executor → counters này bị mutate
+        # từ nhiều thread, cần lock riêng (nhỏ, chỉ quanh mấy phép đếm)
+        self._err_lock = threading.Lock()
         self.consecutive_403_count = 0  # Tổng 403 liên tiếp (all workers)
         self.worker_error_counts: Dict[str, int] = {}  # Per-worker consecutive errors
         self.max_403_before_ipv6 = 5  # Đổi IPv6 sau 5 lần 403
@@ -860,7 +1142,7 @@ class VMManager:
 
         # Auto-detect
         self.auto_path = self._detect_auto_path()
-        self.channel = self._get_channel_from_folder()
+        self.channel = _channel_from_folder()
 
     def _setup_agent_dirs(self):
         for d in [AGENT_DIR, TASKS_DIR, RESULTS_DIR, STATUS_DIR, LOGS_DIR]:
@@ -879,20 +1161,53 @@ class VMManager:
             self.workers[wid] = WorkerInfo(worker_id=wid, worker_type="chrome", worker_num=i+1)
 
     def _detect_auto_path(self) -> Optional[Path]:
-        for p in [Path(r"\\tsclient\D\AUTO"), Path(r"\\vmware-host\Shared Folders\D\AUTO"),
-                  Path(r"Z:\AUTO"), Path(r"Y:\AUTO"), Path(r"D:\AUTO")]:
+        """
+        Dò AUTO path. Probe UNC (\\\\tsclient, \\\\vmware-host) có thể treo
+        nhiều giây theo SMB timeout khi share offline, nên:
+        1. Warm start: đọc cache từ lần chạy trước (TTL 1 ngày), chỉ cần
+           1 lần isdir để validate - khỏi probe mạng
+        2. Cache miss: probe tất cả candidates song song, chờ tối đa 1.5s
+           thay vì cộng dồn từng SMB timeout tuần tự
+        """
+        try:
+            if (AUTO_PATH_CACHE.exists()
+                    and time.time() - AUTO_PATH_CACHE.stat().st_mtime < AUTO_PATH_CACHE_TTL):
+                cached = AUTO_PATH_CACHE.read_text(encoding='utf-8').strip()
+                if cached and os.path.isdir(cached):
+                    return Path(cached)
+        except OSError:
+            pass
+
+        candidates = [Path(r"\\tsclient\D\AUTO"), Path(r"\\vmware-host\Shared Folders\D\AUTO"),
+                      Path(r"Z:\AUTO"), Path(r"Y:\AUTO"), Path(r"D:\AUTO")]
+
+        def probe(p: Path) -> bool:
             try:
-                if p.exists():
-                    return p
+                return _fast_exists(p)
             except:
-                pass
-        return None
+                return False
 
-    def _get_channel_from_folder(self) -> Optional[str]:
-        folder = TOOL_DIR.parent.name
-        if "-T" in folder:
-            return folder.split("-T")[0]
-        return None
+        # Không dùng context manager: shutdown(wait=False) để probe SMB
+        # còn treo không chặn startup
+        ex = ThreadPoolExecutor(max_workers=len(candidates))
+        futures = [(p, ex.submit(probe, p)) for p in candidates]
+        found = None
+        deadline = time.monotonic() + 1.5
+        for p, fut in futures:
+            try:
+                if fut.result(timeout=max(0.0, deadline - time.monotonic())):
+                    found = p
+                    break
+            except Exception:
+                continue
+        ex.shutdown(wait=False)
+
+        if found:
+            try:
+                AUTO_PATH_CACHE.write_text(str(found), encoding='utf-8')
+            except OSError:
+                pass
+        return found
 
     # ================================================================================
     # CHROME AUTO-SCALING
@@ -976,63 +1291,18 @@ class VMManager:
 
     def ensure_chrome_script(self, worker_num: int) -> Optional[Path]:
         """
-        Đảm bảo script _run_chromeN.py tồn tại.
-        Nếu chưa có, tạo từ template.
-        """
-        script_path = TOOL_DIR / f"_run_chrome{worker_num}.py"
-
-        if script_path.exists():
-            return script_path
-
-        # Template cho Chrome worker script
-        self.log(f"Creating script: {script_path.name}", "CHROME")
-
-        # Copy từ _run_chrome1.py và sửa worker number
-        base_script = TOOL_DIR / "_run_chrome1.py"
-        if not base_script.exists():
-            self.log("Base script _run_chrome1.py not found", "CHROME", "ERROR")
-            return None
-
-        try:
-            with open(base_script, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Cập nhật parallel_chrome setting cho worker này
-            # Thay "1/2" thành "N/total"
-            import re
-            # Tìm và thay thế pattern parallel_chrome
-            content = re.sub(
-                r"parallel_chrome\s*=\s*['\"][^'\"]*['\"]",
-                f'parallel_chrome = "{worker_num}/{self.num_chrome_workers}"',
-                content
-            )
-
-            # Cập nhật WORKER_ID nếu có
-            content = re.sub(
-                r"WORKER_ID\s*=\s*['\"]chrome_\d+['\"]",
-                f'WORKER_ID = "chrome_{worker_num}"',
-                content
-            )
-
-            # Cập nhật chrome portable path cho worker này
-            chrome_path = self.get_chrome_path_for_worker(worker_num)
-            if chrome_path:
-                # Thêm logic để dùng Chrome portable riêng
-                content = re.sub(
-                    r"(# Chrome portable path)",
-                    f'# Chrome portable path for worker {worker_num}\n'
-                    f'CHROME_PORTABLE_{worker_num} = Path(r"{chrome_path}")',
-                    content
-                )
+        Trả về script cho Chrome worker N.
 
-            with open(script_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            self.log(f"Created script: {script_path.name}", "CHROME", "SUCCESS")
-            return script_path
-        except Exception as e:
-            self.log(f"Failed to create script: {e}", "CHROME", "ERROR")
-            return None
+        Worker 1/2 có script riêng (workflow khác nhau); worker 3+ dùng chung
+        _run_chrome2.py với WORKER_ID truyền qua env lúc launch - không còn
+        generate bản copy _run_chromeN.py per worker như trước (mỗi bản là
+        1 file + 1 pyc riêng phải compile/load lại).
+        """
+        script = _worker_script("chrome", worker_num)
+        if script.exists():
+            return script
+        self.log(f"Worker script not found: {script.name}", "CHROME", "ERROR")
+        return None
 
     def scale_chrome_workers(self, new_count: int) -> bool:
         """
@@ -1085,9 +1355,8 @@ class VMManager:
         return True
 
     def log(self, msg: str, source: str = "MANAGER", level: str = "INFO"):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        emoji = {"INFO": "  ", "WARN": "[WARN]", "ERROR": "[FAIL]", "SUCCESS": "[OK]", "TASK": "[LIST]"}.get(level, "  ")
-        print(f"[{timestamp}] [{source}] {emoji} {msg}")
+        emoji = _LOG_LEVEL_EMOJI.get(level, "  ")
+        sys.stdout.write(f"[{_log_timestamp()}] [{source}] {emoji} {msg}\n")
 
     # ================================================================================
     # AGENT PROTOCOL INTEGRATION
@@ -1104,6 +1373,8 @@ class VMManager:
                 # Cập nhật status từ agent protocol
                 if agent_status.state == "working":
                     worker.status = WorkerStatus.WORKING
+                    # Worker làm việc bình thường trở lại → reset backoff
+                    worker.restart_times.clear()
                 elif agent_status.state == "idle":
                     worker.status = WorkerStatus.IDLE
                 elif agent_status.state == "error":
@@ -1201,9 +1472,18 @@ class VMManager:
         if not log_file.exists():
             return []
         try:
-            with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                all_lines = f.readlines()
-                return all_lines[-lines:] if len(all_lines) > lines else all_lines
+            # Tail read: chỉ đọc khúc cuối file thay vì readlines() cả file
+            # (log worker chạy lâu lên hàng trăm MB, GUI refresh liên tục)
+            chunk = max(lines * 256, 8192)
+            with open(log_file, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(0, size - chunk))
+                data = f.read()
+            all_lines = data.decode('utf-8', errors='ignore').splitlines(keepends=True)
+            if size > chunk and all_lines:
+                all_lines = all_lines[1:]  # dòng đầu có thể bị cắt giữa chừng
+            return all_lines[-lines:] if len(all_lines) > lines else all_lines
         except Exception as e:
             return [f"Error reading log: {e}"]
 
@@ -1239,32 +1519,33 @@ class VMManager:
             "clear_data" - Xóa data Chrome và login lại
             "rotate_ipv6" - Đổi IPv6 và restart tất cả
         """
-        # Track per-worker errors
-        if worker_id not in self.worker_error_counts:
-            self.worker_error_counts[worker_id] = 0
-
         if error_type == "chrome_403":
             # Track 403 globally
-            self.consecutive_403_count += 1
-            self.worker_error_counts[worker_id] += 1
+            with self._err_lock:
+                self.consecutive_403_count += 1
+                count_403 = self.consecutive_403_count
+                worker_count = self.worker_error_counts.get(worker_id, 0) + 1
+                self.worker_error_counts[worker_id] = worker_count
 
-            self.log(f"403 count: {self.consecutive_403_count}/{self.max_403_before_ipv6} (global), "
-                     f"{self.worker_error_counts[worker_id]} ({worker_id})", "ERROR", "WARN")
+            self.log(f"403 count: {count_403}/{self.max_403_before_ipv6} (global), "
+                     f"{worker_count} ({worker_id})", "ERROR", "WARN")
 
             # Check if need IPv6 rotation
-            if self.consecutive_403_count >= self.max_403_before_ipv6:
+            if count_403 >= self.max_403_before_ipv6:
                 return "rotate_ipv6"
 
             # Check if need Chrome data clear (3 consecutive for same worker)
-            if self.worker_error_counts[worker_id] >= self.max_errors_before_clear:
+            if worker_count >= self.max_errors_before_clear:
                 return "clear_data"
 
             return "restart"
 
         elif error_type in ("chrome_crash", "timeout", "unknown"):
-            self.worker_error_counts[worker_id] += 1
+            with self._err_lock:
+                worker_count = self.worker_error_counts.get(worker_id, 0) + 1
+                self.worker_error_counts[worker_id] = worker_count
 
-            if self.worker_error_counts[worker_id] >= self.max_errors_before_clear:
+            if worker_count >= self.max_errors_before_clear:
                 return "clear_data"
 
             return "restart"
@@ -1273,12 +1554,13 @@ class VMManager:
 
     def reset_error_tracking(self, worker_id: str = None):
         """Reset error tracking (sau khi action thành công)."""
-        if worker_id:
-            self.worker_error_counts[worker_id] = 0
-        else:
-            # Reset all
-            self.consecutive_403_count = 0
-            self.worker_error_counts.clear()
+        with self._err_lock:
+            if worker_id:
+                self.worker_error_counts[worker_id] = 0
+            else:
+                # Reset all
+                self.consecutive_403_count = 0
+                self.worker_error_counts.clear()
 
     def perform_ipv6_rotation(self) -> bool:
         """
@@ -1301,9 +1583,8 @@ class VMManager:
             if w.worker_type == "chrome":
                 self.stop_worker(wid)
 
-        # 2. Kill all Chrome processes
+        # 2. Kill all Chrome processes (tự đợi process chết hẳn)
         self.kill_all_chrome()
-        time.sleep(2)
 
         # 3. Rotate IPv6
         result = self.ipv6_manager.rotate_ipv6()
@@ -1316,10 +1597,7 @@ class VMManager:
 
             # 5. Wait and restart Chrome workers
             time.sleep(3)
-            for wid, w in self.workers.items():
-                if w.worker_type == "chrome":
-                    self.start_worker(wid, gui_mode=self.gui_mode)
-                    time.sleep(2)
+            self._start_chrome_workers_parallel()
 
             return True
         else:
@@ -1371,23 +1649,28 @@ class VMManager:
             self.clear_chrome_data(worker_id)
 
         elif action == "restart":
-            self.restart_worker(worker_id)
+            # Cùng 1 crash có thể kích cả exit monitor lẫn health check:
+            # claim slot như _schedule_restart để 2 đường không restart
+            # chồng nhau (double backoff, 2 start_worker đè process)
+            if not self._claim_restart(worker_id):
+                return
+            try:
+                self.restart_worker(worker_id)
+            finally:
+                self._release_restart(worker_id)
             # Reset count cho worker này sau restart
-            self.worker_error_counts[worker_id] = max(0, self.worker_error_counts.get(worker_id, 1) - 1)
+            with self._err_lock:
+                self.worker_error_counts[worker_id] = max(0, self.worker_error_counts.get(worker_id, 1) - 1)
 
     # ================================================================================
     # TASK MANAGEMENT
     # ================================================================================
 
     def create_task(self, task_type: TaskType, project_code: str, scenes: List[int] = None) -> Task:
-        task_id = f"{task_type.value}_{project_code}_{datetime.now().strftime('%H%M%S%f')[:10]}"
-        task = Task(
-            task_id=task_id,
-            task_type=task_type,
-            project_code=project_code,
-            scenes=scenes or [],
-            created_at=datetime.now().isoformat(),
-        )
+        now = datetime.now()
+        task_id = f"{task_type.value}_{project_code}_{now.strftime('%H%M%S%f')[:10]}"
+        task = TaskPool.acquire(task_id, task_type, project_code, scenes,
+                                created_at=now.isoformat())
         self.tasks[task_id] = task
         if project_code not in self.project_tasks:
             self.project_tasks[project_code] = []
@@ -1515,14 +1798,135 @@ class VMManager:
     # WORKER CONTROL
     # ================================================================================
 
+    @staticmethod
+    def _prewarm_bytecode():
+        """
+        Compile sẵn .pyc cho worker scripts và modules/ (chạy nền lúc init).
+
+        Restart worker nào cũng là 1 interpreter mới; nếu .pyc chưa có
+        (lần đầu / vừa update code) thì mỗi lần start trả thêm hàng trăm ms
+        parse+compile. Làm trước 1 lần ở manager thì mọi spawn sau chỉ load.
+        """
+        import compileall
+        for script in ("_run_chrome1.py", "_run_chrome2.py",
+                       "run_excel_api.py", "run_worker.py", "run_worker_video.py"):
+            path = TOOL_DIR / script
+            if path.exists():
+                try:
+                    compileall.compile_file(str(path), quiet=2)
+                except Exception:
+                    pass
+        try:
+            compileall.compile_dir(str(TOOL_DIR / "modules"), quiet=2)
+        except Exception:
+            pass
+
+    # Tên process Chrome cần kill/đợi
+    _CHROME_IMAGE_NAMES = ('chrome.exe', 'GoogleChromePortable.exe')
+
+    def _chrome_pids(self) -> List[int]:
+        """PID các process Chrome đang sống (Linux đọc /proc, không fork)."""
+        pids = []
+        if sys.platform == "win32":
+            if PSUTIL_ENABLED:
+                for p in psutil.process_iter(['name']):
+                    if p.info['name'] in self._CHROME_IMAGE_NAMES:
+                        pids.append(p.pid)
+        else:
+            for entry in os.listdir('/proc'):
+                if not entry.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry}/comm', 'rb') as f:
+                        comm = f.read()
+                except OSError:
+                    continue
+                if b'chrome' in comm.lower():
+                    pids.append(int(entry))
+        return pids
+
+    @staticmethod
+    def _pid_alive(pid: int) -> bool:
+        if sys.platform == "win32":
+            return PSUTIL_ENABLED and psutil.pid_exists(pid)
+        return os.path.exists(f"/proc/{pid}")
+
     def kill_all_chrome(self):
         self.log("Killing Chrome...", "SYSTEM")
+        pids = self._chrome_pids()
         if sys.platform == "win32":
-            subprocess.run(["taskkill", "/F", "/IM", "chrome.exe"], capture_output=True)
-            subprocess.run(["taskkill", "/F", "/IM", "GoogleChromePortable.exe"], capture_output=True)
+            # 1 lần taskkill cho cả 2 image + CREATE_NO_WINDOW: đỡ 1 lần
+            # load taskkill.exe và không chớp cửa sổ console mỗi restart
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/IM", "chrome.exe", "/IM", "GoogleChromePortable.exe"],
+                capture_output=True,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+                timeout=10,
+            )
+        elif PSUTIL_ENABLED:
+            # In-process qua psutil: khỏi fork pkill, và match đúng tên
+            # process thay vì substring cả cmdline (không đụng chromedriver
+            # hay process lạ có "chrome" trong args)
+            victims = []
+            for p in psutil.process_iter(['name']):
+                name = (p.info['name'] or '').lower()
+                if name in ('chrome', 'chromium', 'google-chrome', 'googlechromeportable'):
+                    try:
+                        p.kill()
+                        victims.append(p)
+                    except psutil.NoSuchProcess:
+                        pass
+            psutil.wait_procs(victims, timeout=2)
         else:
-            subprocess.run(["pkill", "-f", "chrome"], capture_output=True)
-        time.sleep(2)
+            # 1 lần pkill cho cả chrome lẫn GoogleChromePortable: pattern là
+            # ERE case-sensitive nên "chrome" không bắt được tên viết hoa
+            subprocess.run(["pkill", "-f", "[cC]hrome"], capture_output=True)
+
+        # Đợi đúng tới lúc process biến mất (Chrome thường chết <200ms)
+        # thay vì ngủ cố định 2s; trần vẫn 2s như cũ
+        if pids:
+            self._wait_pids_exit(pids, timeout=2.0)
+        elif sys.platform == "win32" and not PSUTIL_ENABLED:
+            time.sleep(2)  # Không enumerate được process - giữ pacing cũ
+
+    def _wait_pids_exit(self, pids: List[int], timeout: float = 2.0):
+        """
+        Chặn đúng tới lúc toàn bộ pids chết (trần timeout giây).
+
+        Linux: pidfd_open + select → kernel đánh thức ngay lúc process exit,
+        không poll. Pid chết giữa chừng / kernel cũ thì rơi về vòng poll 50ms.
+        """
+        deadline = time.monotonic() + timeout
+        if hasattr(os, 'pidfd_open'):
+            import select
+            fds = []
+            try:
+                for pid in pids:
+                    try:
+                        fds.append(os.pidfd_open(pid))
+                    except OSError:
+                        pass  # Đã chết rồi hoặc không mở được
+                pending = set(fds)
+                while pending:
+                    remain = deadline - time.monotonic()
+                    if remain <= 0:
+                        break
+                    ready, _, _ = select.select(list(pending), [], [], remain)
+                    if not ready:
+                        break
+                    pending.difference_update(ready)
+                return
+            finally:
+                for fd in fds:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+        while time.monotonic() < deadline:
+            pids = [p for p in pids if self._pid_alive(p)]
+            if not pids:
+                break
+            time.sleep(0.05)
 
     # ================================================================================
     # CHROME WINDOW MANAGEMENT (Hide/Show by moving off-screen)
@@ -1793,18 +2197,20 @@ class VMManager:
 
         self.log(f"Starting {worker_id}...", worker_id)
         try:
-            if w.worker_type == "excel":
-                script = TOOL_DIR / "run_excel_api.py"
-                args = "--loop"  # Excel worker chạy loop liên tục
-            else:
-                script = TOOL_DIR / f"_run_chrome{w.worker_num}.py"
-                args = ""  # Chrome workers chạy bình thường
-
-            if not script.exists():
-                # Fallback nếu không có script riêng
-                self.log(f"Script not found: {script.name}", worker_id, "ERROR")
-                w.status = WorkerStatus.ERROR
-                return False
+            script = _worker_script(w.worker_type, w.worker_num)
+            # Excel worker chạy loop liên tục, Chrome workers chạy bình thường
+            args = "--loop" if w.worker_type == "excel" else ""
+
+            # Cache stat() theo script: restart storm không re-stat file
+            # không bao giờ đổi. Chỉ cache kết quả dương - script thiếu thì
+            # lần start sau vẫn kiểm tra lại (user có thể vừa thêm file)
+            if str(script) not in self._script_ok:
+                if not script.exists():
+                    # Fallback nếu không có script riêng
+                    self.log(f"Script not found: {script.name}", worker_id, "ERROR")
+                    w.status = WorkerStatus.ERROR
+                    return False
+                self._script_ok[str(script)] = True
 
             # Ensure logs directory exists
             log_dir = LOGS_DIR
@@ -1812,16 +2218,15 @@ class VMManager:
             log_file = log_dir / f"{worker_id}.log"
 
             if sys.platform == "win32":
-                # Windows - start with cmd window
+                # Windows - start with console window
                 title = f"{w.worker_type.upper()} {w.worker_num or ''}"
-                cmd_args = f"python -X utf8 {script.name}"
-                if args:
-                    cmd_args += f" {args}"
 
                 # Prepare environment with UTF-8 encoding for subprocess
                 worker_env = os.environ.copy()
                 worker_env['PYTHONIOENCODING'] = 'utf-8'
                 worker_env['PYTHONUTF8'] = '1'
+                # Worker 3+ chạy script dùng chung - nhận identity qua env
+                worker_env['VE3_WORKER_ID'] = worker_id
 
                 if gui_mode:
                     # GUI mode - minimize CMD window, redirect output to log file
@@ -1854,21 +2259,51 @@ class VMManager:
                     )
                     w._log_handle = log_handle
                 else:
-                    # Normal mode - visible CMD window with UTF-8 code page
-                    cmd = f'start "{title}" cmd /k "chcp 65001 >nul && cd /d {TOOL_DIR} && {cmd_args}"'
-                    w.process = subprocess.Popen(cmd, shell=True, cwd=str(TOOL_DIR), env=worker_env)
+                    # Normal mode - console riêng qua CREATE_NEW_CONSOLE, không
+                    # qua chuỗi start → cmd.exe → cmd.exe trung gian (đỡ 2
+                    # process + ~100ms mỗi worker). Title do worker tự đặt từ
+                    # VE3_CONSOLE_TITLE (hide/show CMD windows match theo title).
+                    cmd_list = [sys.executable, '-X', 'utf8', str(script)]
+                    if args:
+                        cmd_list.extend(args.split())
+                    worker_env['VE3_CONSOLE_TITLE'] = title.strip()
+                    w.process = subprocess.Popen(
+                        cmd_list,
+                        cwd=str(TOOL_DIR),
+                        env=worker_env,
+                        creationflags=subprocess.CREATE_NEW_CONSOLE,
+                    )
             else:
                 # Linux/Mac
                 worker_env = os.environ.copy()
                 worker_env['PYTHONIOENCODING'] = 'utf-8'
                 worker_env['PYTHONUTF8'] = '1'
+                worker_env['VE3_WORKER_ID'] = worker_id
                 cmd_list = [sys.executable, '-X', 'utf8', str(script)]
                 if args:
                     cmd_list.extend(args.split())
-                w.process = subprocess.Popen(cmd_list, cwd=str(TOOL_DIR), env=worker_env)
+                if hasattr(os, 'posix_spawn') and os.getcwd() == str(TOOL_DIR):
+                    # vfork-based spawn, không tốn COW page-table setup như
+                    # fork+exec. Chỉ dùng được khi cwd đã là TOOL_DIR vì
+                    # posix_spawn không có tham số cwd.
+                    w.process = _SpawnedProcess(cmd_list, worker_env)
+                else:
+                    # close_fds=True + pass_fds=() để subprocess dùng close_range(2)
+                    # thay vì đóng lần lượt fd tới RLIMIT_NOFILE (đáng kể khi ulimit
+                    # cao và restart nhiều); start_new_session tách process group để
+                    # Ctrl+C ở manager không SIGINT thẳng vào worker trước stop_all
+                    w.process = subprocess.Popen(
+                        cmd_list,
+                        cwd=str(TOOL_DIR),
+                        env=worker_env,
+                        close_fds=True,
+                        pass_fds=(),
+                        start_new_session=True,
+                    )
+                self._register_exit_watch(worker_id, w.process)
 
             w.status = WorkerStatus.IDLE
-            w.start_time = datetime.now()
+            w.start_mono = time.monotonic()
             self.log(f"{worker_id} started", worker_id, "SUCCESS")
             return True
         except Exception as e:
@@ -1879,42 +2314,279 @@ class VMManager:
             w.last_error = str(e)
             return False
 
+    def _wait_worker_ready(self, worker_id: str, timeout: float = 10.0):
+        """
+        Đợi worker thực sự sẵn sàng (báo status qua Agent Protocol) thay vì
+        sleep cố định 2s. Worker ghi .agent/status/{id}.json ngay khi init.
+        Fallback: nếu không có Agent Protocol hoặc timeout thì sleep 2s như cũ.
+        """
+        if not self.agent_protocol:
+            time.sleep(2)
+            return
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.agent_protocol.is_worker_alive(worker_id, timeout_seconds=15):
+                return
+            time.sleep(0.2)
+        # Không thấy readiness signal - giữ pacing cũ cho an toàn
+        time.sleep(2)
+
+    def _start_chrome_workers_parallel(self):
+        """
+        Start toàn bộ Chrome workers rồi đợi readiness đồng thời.
+
+        Launch + wait tuần tự làm wall time tăng tuyến tính theo số worker
+        (mỗi worker tới 2-10s). Launch hết một lượt rồi chờ readiness song
+        song thì critical path chỉ còn bằng worker chậm nhất.
+        """
+        chrome_ids = [wid for wid, w in self.workers.items() if w.worker_type == "chrome"]
+        if not chrome_ids:
+            return
+        for wid in chrome_ids:
+            self.start_worker(wid, gui_mode=self.gui_mode)
+        with ThreadPoolExecutor(max_workers=len(chrome_ids)) as ex:
+            for _ in ex.map(self._wait_worker_ready, chrome_ids):
+                pass
+
+    def _register_exit_watch(self, worker_id: str, proc):
+        """
+        Đăng ký pidfd của worker vào epoll chung (Linux).
+
+        Không có pidfd_open (Windows / kernel cũ) thì chỉ lo phần revive
+        thread monitor (hút sigchld pipe) - health check 60s vẫn là fallback
+        như cũ.
+        """
+        import select
+        pidfd = None
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(proc.pid)
+            except OSError:
+                pidfd = None
+        with self._exit_mon_lock:
+            if self._exit_epoll is None:
+                if pidfd is None:
+                    return
+                # pidfd_open có → Linux → chắc chắn có epoll
+                self._exit_epoll = select.epoll()
+                if self._sigchld_r is not None:
+                    self._exit_epoll.register(self._sigchld_r, select.EPOLLIN)
+            # Thread monitor thoát khi stop_all giơ cờ dừng - start lại
+            # giữa phiên (scale / Stop All rồi Start) thì dựng thread mới.
+            # Phải revive cả khi không có pidfd: sigchld pipe cần người hút
+            if self._exit_mon_thread is None or not self._exit_mon_thread.is_alive():
+                self._exit_mon_thread = threading.Thread(
+                    target=self._exit_monitor_loop, daemon=True)
+                self._exit_mon_thread.start()
+            if pidfd is not None:
+                self._exit_epoll.register(pidfd, select.EPOLLIN)
+                self._pidfd_map[pidfd] = worker_id
+
+    def _exit_monitor_loop(self):
+        """1 thread epoll đợi pidfd của TẤT CẢ workers - chết là biết ngay."""
+        while not self._stop_flag:
+            try:
+                events = self._exit_epoll.poll(1.0)
+            except OSError:
+                return
+            for fd, _ in events:
+                if fd == self._sigchld_r:
+                    self._drain_sigchld(fd)
+                    continue
+                with self._exit_mon_lock:
+                    worker_id = self._pidfd_map.pop(fd, None)
+                    try:
+                        self._exit_epoll.unregister(fd)
+                    except OSError:
+                        pass
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+                if worker_id and worker_id in self.workers:
+                    w = self.workers[worker_id]
+                    if w.process:
+                        w.process.poll()  # Reap zombie
+                    # stop_worker kill chủ đích cũng làm pidfd fire - chỉ coi
+                    # là chết bất thường khi worker chưa bị dừng/park
+                    if self._stop_flag or w.status in (WorkerStatus.STOPPED, WorkerStatus.ERROR):
+                        continue
+                    w.status = WorkerStatus.ERROR
+                    w.last_error = "process exited"
+                    self.log(f"{worker_id} process exited", worker_id, "WARN")
+                    self._notify_state_change()
+                    # Restart event-driven ngay trên bg executor thay vì đợi
+                    # health check chu kỳ sau mới phát hiện
+                    self._schedule_restart(worker_id)
+
+    def _drain_sigchld(self, fd: int):
+        """
+        Xử lý wakeup SIGCHLD: hút hết byte trong pipe rồi poll() các worker
+        không có pidfd watch - fallback cho kernel cũ, phát hiện chết vẫn
+        tức thì thay vì đợi health check.
+        """
+        while True:
+            try:
+                if not os.read(fd, 512):
+                    break
+            except BlockingIOError:
+                break
+            except OSError:
+                return
+        with self._exit_mon_lock:
+            watched = set(self._pidfd_map.values())
+        for worker_id, w in list(self.workers.items()):
+            if worker_id in watched or not w.process:
+                continue
+            if w.status in (WorkerStatus.STOPPED, WorkerStatus.ERROR):
+                continue
+            if w.process.poll() is not None:  # Reap zombie
+                w.status = WorkerStatus.ERROR
+                w.last_error = "process exited"
+                self.log(f"{worker_id} process exited", worker_id, "WARN")
+                self._notify_state_change()
+                self._schedule_restart(worker_id)
+
+    def _stop_process_pidfd(self, proc) -> bool:
+        """
+        Dừng process qua pidfd (Linux): SIGTERM rồi chờ sự kiện exit trên
+        pidfd bằng select - kernel wakeup đúng lúc process chết thay vì
+        vòng poll bên trong Popen.wait. Trả False nếu không có pidfd để
+        caller fallback terminate/wait như cũ.
+        """
+        if not (hasattr(signal, 'pidfd_send_signal') and hasattr(os, 'pidfd_open')):
+            return False
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            return False
+        try:
+            import select
+            try:
+                signal.pidfd_send_signal(pidfd, signal.SIGTERM)
+            except ProcessLookupError:
+                proc.poll()  # Đã chết sẵn - chỉ cần reap
+                return True
+            ready, _, _ = select.select([pidfd], [], [], 5.0)
+            if not ready:
+                try:
+                    signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            proc.wait(timeout=2)
+            return True
+        except Exception:
+            return False
+        finally:
+            try:
+                os.close(pidfd)
+            except OSError:
+                pass
+
     def stop_worker(self, worker_id: str):
         if worker_id not in self.workers:
             return
         w = self.workers[worker_id]
+        # Set STOPPED trước khi kill để exit monitor biết đây là dừng chủ
+        # đích, không phải crash cần auto-restart
+        w.status = WorkerStatus.STOPPED
         if w.process:
-            try:
-                w.process.terminate()
-                w.process.wait(timeout=5)
-            except:
-                w.process.kill()
+            if not self._stop_process_pidfd(w.process):
+                try:
+                    w.process.terminate()
+                    w.process.wait(timeout=5)
+                except:
+                    w.process.kill()
             w.process = None
         # Close log handle if exists (hidden mode)
-        if hasattr(w, '_log_handle') and w._log_handle:
+        if w._log_handle:
             try:
                 w._log_handle.close()
             except:
                 pass
             w._log_handle = None
-        w.status = WorkerStatus.STOPPED
         w.current_task = None
+        # Xóa status file để heartbeat cũ không làm _wait_worker_ready tưởng
+        # worker mới đã sẵn sàng ngay sau restart
+        try:
+            (STATUS_DIR / f"{worker_id}.json").unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            pass
+
+    def _claim_restart(self, worker_id: str) -> bool:
+        """Giành slot restart cho worker. False = đã có restart đang chờ/chạy."""
+        with self._restart_lock:
+            if worker_id in self._restart_pending:
+                return False
+            self._restart_pending.add(worker_id)
+            return True
+
+    def _release_restart(self, worker_id: str):
+        with self._restart_lock:
+            self._restart_pending.discard(worker_id)
+
+    def _schedule_restart(self, worker_id: str):
+        """
+        Queue restart_worker lên bg executor, tối đa 1 restart đang chờ
+        mỗi worker - burst lỗi/exit event không đẻ ra N lần restart thừa.
+        """
+        if not self._claim_restart(worker_id):
+            return
+
+        def _run():
+            try:
+                self.restart_worker(worker_id)
+            finally:
+                self._release_restart(worker_id)
+
+        try:
+            self._bg_exec.submit(_run)
+        except RuntimeError:
+            # Executor vừa bị stop_all shutdown - nhả slot pending để lần
+            # start lại không bị kẹt, và không để exception giết monitor thread
+            self._release_restart(worker_id)
+
+    # Backoff giữa các lần restart: 3s, 6s, 12s... trần 60s
+    RESTART_BASE_DELAY = 3.0
+    RESTART_MAX_DELAY = 60.0
+    RESTART_STORM_WINDOW = 60.0  # maxlen lần restart trong 60s → park ERROR
+
+    def restart_worker(self, worker_id: str) -> bool:
+        w = self.workers[worker_id]
+
+        # Worker crash xác định (profile hỏng, thiếu binary...) sẽ chết ngay
+        # sau mỗi lần start → vòng restart 12 lần/phút chỉ đốt CPU fork/exec.
+        # Quá maxlen lần trong cửa sổ thì park ở ERROR, chờ user xử lý.
+        now = time.monotonic()
+        times = w.restart_times
+        if len(times) == times.maxlen and now - times[0] < self.RESTART_STORM_WINDOW:
+            if w.status != WorkerStatus.ERROR:
+                w.status = WorkerStatus.ERROR
+                w.last_error = "restart storm - auto-restart paused"
+            self.log(f"{worker_id} restarting too fast, parked in ERROR", worker_id, "ERROR")
+            return False
+        times.append(now)
 
-    def restart_worker(self, worker_id: str):
         self.log(f"Restarting {worker_id}...", worker_id, "WARN")
         self.stop_worker(worker_id)
 
-        w = self.workers[worker_id]
         if w.worker_type == "chrome":
             self.kill_all_chrome()
 
-        time.sleep(3)
+        # Backoff mũ + jitter theo số lần restart gần đây thay vì 3s cố định
+        delay = min(self.RESTART_MAX_DELAY,
+                    self.RESTART_BASE_DELAY * (2 ** (len(times) - 1)))
+        time.sleep(delay + random.uniform(0, 0.5))
         self.start_worker(worker_id, gui_mode=self.gui_mode)
 
         # Track restart time và count
         w.last_restart_time = datetime.now()
         w.restart_count += 1
         self.log(f"{worker_id} restarted (count: {w.restart_count})", worker_id, "SUCCESS")
+        return True
 
     def check_and_auto_recover(self) -> bool:
         """Check for connection errors and auto-recover if needed.
@@ -1935,7 +2607,7 @@ class VMManager:
             # Count recent connection errors
             connection_errors = 0
             for line in logs[-10:]:  # Check last 10 lines
-                if "connection" in line.lower() and ("disconnected" in line.lower() or "lost" in line.lower()):
+                if _CONN_ERROR_RE.search(line):
                     connection_errors += 1
                 elif "RETRY" in line and connection_errors > 0:
                     connection_errors += 1
@@ -1944,9 +2616,8 @@ class VMManager:
                 self.log(f"[AUTO-RECOVERY] Detected {connection_errors} connection errors in {worker_id}", "SYSTEM", "WARN")
                 self.log("[AUTO-RECOVERY] Killing all Chrome and restarting workers...", "SYSTEM", "WARN")
 
-                # Kill all Chrome
+                # Kill all Chrome (tự đợi process chết hẳn)
                 self.kill_all_chrome()
-                time.sleep(2)
 
                 # Restart all Chrome workers
                 for wid in list(self.workers.keys()):
@@ -1955,10 +2626,7 @@ class VMManager:
 
                 time.sleep(3)
 
-                for wid in list(self.workers.keys()):
-                    if wid.startswith("chrome_"):
-                        self.start_worker(wid, gui_mode=self.gui_mode)
-                        time.sleep(2)
+                self._start_chrome_workers_parallel()
 
                 self.log("[AUTO-RECOVERY] Chrome workers restarted!", "SYSTEM", "SUCCESS")
                 return True
@@ -1969,9 +2637,8 @@ class VMManager:
         """Restart all Chrome workers (kill Chrome first)."""
         self.log("Restarting all Chrome workers...", "SYSTEM", "WARN")
 
-        # Kill all Chrome processes
+        # Kill all Chrome processes (tự đợi process chết hẳn)
         self.kill_all_chrome()
-        time.sleep(2)
 
         # Stop all Chrome workers
         for wid in list(self.workers.keys()):
@@ -1981,10 +2648,7 @@ class VMManager:
         time.sleep(3)
 
         # Start all Chrome workers
-        for wid in list(self.workers.keys()):
-            if wid.startswith("chrome_"):
-                self.start_worker(wid, gui_mode=self.gui_mode)
-                time.sleep(2)
+        self._start_chrome_workers_parallel()
 
         self.log("All Chrome workers restarted!", "SYSTEM", "SUCCESS")
 
@@ -1995,16 +2659,28 @@ class VMManager:
             gui_mode: If True, minimize CMD windows and log to files (for GUI mode)
         """
         self.gui_mode = gui_mode  # Track mode for restart
+        if self._stop_flag:
+            # Resume sau stop_all (scale / Stop All của GUI): executor đã
+            # shutdown, submit tiếp sẽ RuntimeError - tạo executor mới,
+            # hạ cờ dừng và xóa restart đang treo của phiên trước
+            self._stop_flag = False
+            self._bg_exec = ThreadPoolExecutor(max_workers=2, thread_name_prefix="vmmgr")
+            with self._restart_lock:
+                self._restart_pending.clear()
         self.kill_all_chrome()
         if self.enable_excel:
             self.start_worker("excel", gui_mode=gui_mode)
-            time.sleep(2)
-        for i in range(1, self.num_chrome_workers + 1):
-            self.start_worker(f"chrome_{i}", gui_mode=gui_mode)
-            time.sleep(2)
+            self._wait_worker_ready("excel")
+        self._start_chrome_workers_parallel()
 
     def stop_all(self):
         self._stop_flag = True
+        if sys.version_info >= (3, 9):
+            self._bg_exec.shutdown(wait=False, cancel_futures=True)
+        else:
+            # cancel_futures chỉ có từ 3.9 - hàng chờ executor nhỏ, task
+            # còn lại tự thoát sớm nhờ _stop_flag
+            self._bg_exec.shutdown(wait=False)
         for wid in list(self.workers.keys()):
             self.stop_worker(wid)
         self.kill_all_chrome()
@@ -2033,7 +2709,10 @@ class VMManager:
                     for wid, error_type in workers_with_errors:
                         # Sử dụng handle_worker_error thay vì restart trực tiếp
                         # Hàm này sẽ quyết định: restart, clear data, hoặc IPv6 rotation
-                        self.handle_worker_error(wid, error_type)
+                        try:
+                            self._bg_exec.submit(self.handle_worker_error, wid, error_type)
+                        except RuntimeError:
+                            break  # stop_all vừa shutdown executor - loop sắp thoát
 
                 # 4. Check completed tasks và retry nếu cần
                 for task in list(self.tasks.values()):
@@ -2041,6 +2720,12 @@ class VMManager:
                         retry = self.check_and_retry(task)
                         if retry:
                             task.status = TaskStatus.FAILED
+                        else:
+                            # Terminal (pass quality check hoặc hết retry):
+                            # bỏ khỏi history để không check lại mỗi cycle,
+                            # trả object về pool tái dùng
+                            self.tasks.pop(task.task_id, None)
+                            TaskPool.release(task)
 
                 # 5. Scan projects mới và tạo tasks
                 for project in self.scan_projects():
@@ -2072,167 +2757,248 @@ class VMManager:
     # INTERACTIVE
     # ================================================================================
 
-    def run_interactive(self):
+    @staticmethod
+    def _resolve_worker_target(target: str) -> str:
+        """"1" → "chrome_1", còn lại ("excel", "chrome_2"...) giữ nguyên."""
+        return f"chrome_{target}" if target.isdigit() else target
+
+    def _cmd_status(self, arg: str = ""):
         self.dashboard.clear_screen()
         print(self.dashboard.render())
 
-        self.start_all()
+    def _cmd_tasks(self, arg: str = ""):
+        print("\n  TASKS:")
+        for tid, t in self.tasks.items():
+            print(f"    {tid}: {t.status.value} → {t.assigned_to or '-'}")
 
-        orch_thread = threading.Thread(target=self.orchestrate, daemon=True)
-        orch_thread.start()
+    def _cmd_scan(self, arg: str = ""):
+        projects = self.scan_projects()
+        print(f"\n  Found {len(projects)} projects: {projects}")
 
+    def _cmd_restart(self, arg: str = ""):
+        if not arg:
+            for wid in self.workers:
+                self.restart_worker(wid)
+            return
         try:
-            while not self._stop_flag:
-                try:
-                    cmd = input("\n[VM Manager] > ").strip().lower()
+            num = int(arg.split()[-1])
+            self.restart_worker(f"chrome_{num}")
+        except:
+            pass
 
-                    if not cmd:
-                        continue
-                    elif cmd == "status":
-                        self.dashboard.clear_screen()
-                        print(self.dashboard.render())
-                    elif cmd == "tasks":
-                        print("\n  TASKS:")
-                        for tid, t in self.tasks.items():
-                            print(f"    {tid}: {t.status.value} → {t.assigned_to or '-'}")
-                    elif cmd == "scan":
-                        projects = self.scan_projects()
-                        print(f"\n  Found {len(projects)} projects: {projects}")
-                    elif cmd == "restart":
-                        for wid in self.workers:
-                            self.restart_worker(wid)
-                    elif cmd.startswith("restart "):
+    def _cmd_scale(self, arg: str = ""):
+        try:
+            num = int(arg.split()[-1])
+            # Stop existing workers
+            self.stop_all()
+            # Scale with auto-creation of Chrome profiles
+            if self.scale_chrome_workers(num):
+                self.start_all(gui_mode=self.gui_mode)
+                print(f"  Scaled to {num} Chrome workers")
+            else:
+                print(f"  Failed to scale to {num} workers")
+        except Exception as e:
+            print(f"  Error: {e}")
+
+    def _cmd_logs(self, arg: str = ""):
+        if not arg:
+            print("\n  Usage: logs <worker_id>  (e.g., logs 1, logs excel)")
+            return
+        try:
+            worker_id = self._resolve_worker_target(arg.split()[0])
+            logs = self.get_worker_logs(worker_id, 20)
+            print(f"\n  LOGS [{worker_id}]:")
+            for log in logs:
+                print(f"    {log.strip()}")
+            if not logs:
+                print("    (No logs available)")
+        except Exception as e:
+            print(f"  Error: {e}")
+
+    def _cmd_errors(self, arg: str = ""):
+        print("\n  ERROR SUMMARY:")
+        error_summary = self.get_error_summary()
+        if error_summary:
+            for error_type, count in error_summary.items():
+                print(f"    {error_type}: {count}")
+        else:
+            print("    (No errors)")
+
+        print("\n  WORKER ERRORS:")
+        for wid in self.workers:
+            details = self.get_worker_details(wid)
+            if details and details.get("last_error"):
+                print(f"    [{wid}] {details['last_error_type']}: {details['last_error'][:60]}")
+
+    def _cmd_detail(self, arg: str = ""):
+        if not arg:
+            print("\n  Usage: detail <worker>  (e.g., detail 1, detail excel)")
+            return
+        try:
+            worker_id = self._resolve_worker_target(arg.split()[0])
+            if worker_id not in self.workers:
+                print(f"  Worker not found: {worker_id}")
+                return
+
+            w = self.workers[worker_id]
+            details = self.get_worker_details(worker_id)
+
+            print(f"\n  WORKER DETAIL: {worker_id}")
+            print(f"  {'='*50}")
+            print(f"    Type:           {w.worker_type}")
+            print(f"    Status:         {w.status.value}")
+            print(f"    Completed:      {w.completed_tasks}")
+            print(f"    Failed:         {w.failed_tasks}")
+            print(f"    Restart count:  {w.restart_count}")
+
+            if w.last_restart_time:
+                elapsed = int((datetime.now() - w.last_restart_time).total_seconds())
+                print(f"    Last restart:   {elapsed}s ago")
+
+            if details:
+                print(f"\n    [From Agent Protocol]")
+                print(f"    State:          {details.get('state', '-')}")
+                print(f"    Progress:       {details.get('progress', 0)}%")
+                print(f"    Project:        {details.get('current_project', '-')}")
+                print(f"    Scene:          {details.get('current_scene', 0)}/{details.get('total_scenes', 0)}")
+                print(f"    Uptime:         {details.get('uptime_seconds', 0)}s")
+                if details.get('last_error'):
+                    print(f"    Last error:     [{details.get('last_error_type')}] {details.get('last_error')[:50]}")
+        except Exception as e:
+            print(f"  Error: {e}")
+
+    def _cmd_ipv6(self, arg: str = ""):
+        if arg == "rotate":
+            # Manual rotation
+            if self.ipv6_manager and self.ipv6_manager.enabled:
+                print("\n  Rotating IPv6...")
+                self.perform_ipv6_rotation()
+            else:
+                print("\n  IPv6 rotation disabled or not available")
+            return
+
+        # Hiển thị trạng thái IPv6
+        if self.ipv6_manager:
+            status = self.ipv6_manager.get_status()
+            print(f"\n  IPv6 STATUS:")
+            print(f"    Enabled:        {status['enabled']}")
+            print(f"    Interface:      {status['interface']}")
+            print(f"    Current IPs:    {status['current_ipv6']}")
+            print(f"    Available:      {status['available_count']}")
+            print(f"    Rotations:      {status['rotation_count']}")
+            print(f"    Last rotation:  {status['last_rotation'] or 'Never'}")
+            print(f"\n  ERROR TRACKING:")
+            print(f"    403 count:      {self.consecutive_403_count}/{self.max_403_before_ipv6}")
+            for wid, count in self.worker_error_counts.items():
+                print(f"    {wid}:      {count}/{self.max_errors_before_clear}")
+        else:
+            print("\n  IPv6 Manager not available")
+
+    def _cmd_set(self, arg: str = ""):
+        print(f"\n  SETTINGS:")
+        for k, v in self.settings.get_summary().items():
+            print(f"    {k}: {v}")
+
+    def _build_command_table(self) -> Dict[str, Any]:
+        """Dispatch table: token đầu → handler(arg). O(1) thay vì chuỗi elif."""
+        return {
+            "status": self._cmd_status,
+            "tasks": self._cmd_tasks,
+            "scan": self._cmd_scan,
+            "restart": self._cmd_restart,
+            "scale": self._cmd_scale,
+            "logs": self._cmd_logs,
+            "errors": self._cmd_errors,
+            "detail": self._cmd_detail,
+            "ipv6": self._cmd_ipv6,
+            "set": self._cmd_set,
+        }
+
+    def _notify_state_change(self):
+        """Đánh thức console loop khi worker đổi trạng thái (best-effort)."""
+        if self._notify_w is not None:
+            try:
+                os.write(self._notify_w, b".")
+            except OSError:
+                pass  # Pipe đầy/đóng - console sẽ thấy ở lần gõ status sau
+
+    def _dispatch_command(self, cmd: str, commands: Dict[str, Any]) -> bool:
+        """Xử lý 1 dòng lệnh console. Trả False khi user muốn thoát."""
+        if not cmd:
+            return True
+        action, _, arg = cmd.partition(" ")
+        if action in ("quit", "exit", "q"):
+            return False
+        handler = commands.get(action)
+        if handler:
+            handler(arg.strip())
+        else:
+            print("  Commands: status, tasks, scan, restart, scale, logs, errors, detail, ipv6, set, quit")
+        return True
+
+    def _interactive_select_loop(self, commands: Dict[str, Any]):
+        """
+        POSIX: multiplex stdin + notify pipe bằng selectors - worker chết
+        hiện ngay trên console thay vì đợi user gõ status/Enter.
+        """
+        import selectors
+        sel = selectors.DefaultSelector()
+        sel.register(sys.stdin, selectors.EVENT_READ, "stdin")
+        sel.register(self._notify_r, selectors.EVENT_READ, "notify")
+        need_prompt = True
+        try:
+            while not self._stop_flag:
+                if need_prompt:
+                    sys.stdout.write("\n[VM Manager] > ")
+                    sys.stdout.flush()
+                    need_prompt = False
+                for key, _ in sel.select(timeout=1.0):
+                    if key.data == "notify":
                         try:
-                            num = int(cmd.split()[-1])
-                            self.restart_worker(f"chrome_{num}")
-                        except:
+                            while os.read(self._notify_r, 512):
+                                pass
+                        except OSError:
                             pass
-                    elif cmd.startswith("scale "):
-                        try:
-                            num = int(cmd.split()[-1])
-                            # Stop existing workers
-                            self.stop_all()
-                            # Scale with auto-creation of Chrome profiles
-                            if self.scale_chrome_workers(num):
-                                self.start_all(gui_mode=self.gui_mode)
-                                print(f"  Scaled to {num} Chrome workers")
-                            else:
-                                print(f"  Failed to scale to {num} workers")
-                        except Exception as e:
-                            print(f"  Error: {e}")
-                    elif cmd.startswith("logs "):
-                        try:
-                            parts = cmd.split()
-                            if len(parts) >= 2:
-                                target = parts[1]
-                                if target.isdigit():
-                                    worker_id = f"chrome_{target}"
-                                elif target == "excel":
-                                    worker_id = "excel"
-                                else:
-                                    worker_id = target
-                                logs = self.get_worker_logs(worker_id, 20)
-                                print(f"\n  LOGS [{worker_id}]:")
-                                for log in logs:
-                                    print(f"    {log.strip()}")
-                                if not logs:
-                                    print("    (No logs available)")
-                        except Exception as e:
-                            print(f"  Error: {e}")
-                    elif cmd == "logs":
-                        print("\n  Usage: logs <worker_id>  (e.g., logs 1, logs excel)")
-                    elif cmd == "errors":
-                        print("\n  ERROR SUMMARY:")
-                        error_summary = self.get_error_summary()
-                        if error_summary:
-                            for error_type, count in error_summary.items():
-                                print(f"    {error_type}: {count}")
-                        else:
-                            print("    (No errors)")
-
-                        print("\n  WORKER ERRORS:")
-                        for wid in self.workers:
-                            details = self.get_worker_details(wid)
-                            if details and details.get("last_error"):
-                                print(f"    [{wid}] {details['last_error_type']}: {details['last_error'][:60]}")
-                    elif cmd.startswith("detail "):
-                        try:
-                            parts = cmd.split()
-                            if len(parts) >= 2:
-                                target = parts[1]
-                                if target.isdigit():
-                                    worker_id = f"chrome_{target}"
-                                elif target == "excel":
-                                    worker_id = "excel"
-                                else:
-                                    worker_id = target
-
-                                if worker_id in self.workers:
-                                    w = self.workers[worker_id]
-                                    details = self.get_worker_details(worker_id)
-
-                                    print(f"\n  WORKER DETAIL: {worker_id}")
-                                    print(f"  {'='*50}")
-                                    print(f"    Type:           {w.worker_type}")
-                                    print(f"    Status:         {w.status.value}")
-                                    print(f"    Completed:      {w.completed_tasks}")
-                                    print(f"    Failed:         {w.failed_tasks}")
-                                    print(f"    Restart count:  {w.restart_count}")
-
-                                    if w.last_restart_time:
-                                        elapsed = int((datetime.now() - w.last_restart_time).total_seconds())
-                                        print(f"    Last restart:   {elapsed}s ago")
-
-                                    if details:
-                                        print(f"\n    [From Agent Protocol]")
-                                        print(f"    State:          {details.get('state', '-')}")
-                                        print(f"    Progress:       {details.get('progress', 0)}%")
-                                        print(f"    Project:        {details.get('current_project', '-')}")
-                                        print(f"    Scene:          {details.get('current_scene', 0)}/{details.get('total_scenes', 0)}")
-                                        print(f"    Uptime:         {details.get('uptime_seconds', 0)}s")
-                                        if details.get('last_error'):
-                                            print(f"    Last error:     [{details.get('last_error_type')}] {details.get('last_error')[:50]}")
-                                else:
-                                    print(f"  Worker not found: {worker_id}")
-                        except Exception as e:
-                            print(f"  Error: {e}")
-                    elif cmd == "detail":
-                        print("\n  Usage: detail <worker>  (e.g., detail 1, detail excel)")
-                    elif cmd == "ipv6":
-                        # Hiển thị trạng thái IPv6
-                        if self.ipv6_manager:
-                            status = self.ipv6_manager.get_status()
-                            print(f"\n  IPv6 STATUS:")
-                            print(f"    Enabled:        {status['enabled']}")
-                            print(f"    Interface:      {status['interface']}")
-                            print(f"    Current IPs:    {status['current_ipv6']}")
-                            print(f"    Available:      {status['available_count']}")
-                            print(f"    Rotations:      {status['rotation_count']}")
-                            print(f"    Last rotation:  {status['last_rotation'] or 'Never'}")
-                            print(f"\n  ERROR TRACKING:")
-                            print(f"    403 count:      {self.consecutive_403_count}/{self.max_403_before_ipv6}")
-                            for wid, count in self.worker_error_counts.items():
-                                print(f"    {wid}:      {count}/{self.max_errors_before_clear}")
-                        else:
-                            print("\n  IPv6 Manager not available")
-                    elif cmd == "ipv6 rotate":
-                        # Manual rotation
-                        if self.ipv6_manager and self.ipv6_manager.enabled:
-                            print("\n  Rotating IPv6...")
-                            self.perform_ipv6_rotation()
-                        else:
-                            print("\n  IPv6 rotation disabled or not available")
-                    elif cmd == "set":
-                        print(f"\n  SETTINGS:")
-                        for k, v in self.settings.get_summary().items():
-                            print(f"    {k}: {v}")
-                    elif cmd in ("quit", "exit", "q"):
-                        break
+                        errs = [wid for wid, w in self.workers.items()
+                                if w.status == WorkerStatus.ERROR]
+                        print(f"\n[!] Worker state changed - ERROR: {', '.join(errs) if errs else 'none'}")
+                        need_prompt = True
                     else:
-                        print("  Commands: status, tasks, scan, restart, scale, logs, errors, detail, ipv6, set, quit")
+                        line = sys.stdin.readline()
+                        if not line:
+                            return  # EOF
+                        if not self._dispatch_command(line.strip().lower(), commands):
+                            return
+                        need_prompt = True
+        except KeyboardInterrupt:
+            return
+        finally:
+            sel.close()
 
-                except (EOFError, KeyboardInterrupt):
-                    break
+    def run_interactive(self):
+        self.dashboard.clear_screen()
+        print(self.dashboard.render())
+
+        self.start_all()
+
+        orch_thread = threading.Thread(target=self.orchestrate, daemon=True)
+        orch_thread.start()
+
+        commands = self._build_command_table()
+
+        try:
+            if self._notify_r is not None:
+                self._interactive_select_loop(commands)
+            else:
+                # Windows: select không dùng được cho console stdin - giữ
+                # vòng input() blocking như cũ
+                while not self._stop_flag:
+                    try:
+                        cmd = input("\n[VM Manager] > ").strip().lower()
+                        if not self._dispatch_command(cmd, commands):
+                            break
+                    except (EOFError, KeyboardInterrupt):
+                        break
 
         finally:
             self.stop_all()
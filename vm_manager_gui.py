@@ -31,6 +31,7 @@ from tkinter import ttk, scrolledtext, messagebox
 import threading
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional
@@ -1309,6 +1310,10 @@ class VMManagerGUI:
         self.manager: Optional[VMManager] = None
         self.running = False
 
+        # Executor bounded cho các action nền (start/stop/restart/update):
+        # không spawn 1 thread mới mỗi lần bấm nút, thread được tái dùng
+        self._action_exec = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gui")
+
         # Get current branch
         self.current_branch = self._get_current_branch()
 
@@ -1365,7 +1370,7 @@ class VMManagerGUI:
 
             self.root.after(0, on_complete)
 
-        threading.Thread(target=run, daemon=True).start()
+        self._action_exec.submit(run)
 
     def _set_buttons_state(self, state: str):
         """Enable/disable all action buttons."""
@@ -1824,26 +1829,26 @@ class VMManagerGUI:
         def start_thread():
             # Start workers
             self.manager.start_all(gui_mode=False)
-            # Start orchestration in background
+            # Orchestrate là vòng lặp sống suốt phiên - giữ thread riêng,
+            # không chiếm slot của action executor
             threading.Thread(target=self.manager.orchestrate, daemon=True).start()
 
-        threading.Thread(target=start_thread, daemon=True).start()
+        self._action_exec.submit(start_thread)
 
         # Auto-position Chrome + CMD windows after 10 seconds (give Chrome time to open)
         def auto_position_chrome():
-            import time
-            time.sleep(10)  # Wait for Chrome to open
             if self.manager:
                 self.manager.show_chrome_with_cmd()  # Position Chrome + CMD side by side
 
-        threading.Thread(target=auto_position_chrome, daemon=True).start()
+        # Hẹn giờ qua Tk thay vì chiếm 1 thread ngủ 10s đợi Chrome mở
+        self.root.after(10000, lambda: self._action_exec.submit(auto_position_chrome))
 
     def _stop_all(self):
         """Stop all workers."""
         if self.manager:
             self.running = False
             self._log("Stopping all workers...")
-            threading.Thread(target=self.manager.stop_all, daemon=True).start()
+            self._action_exec.submit(self.manager.stop_all)
 
     def _restart_all(self):
         """Restart all workers."""
@@ -1852,25 +1857,25 @@ class VMManagerGUI:
             def restart_thread():
                 for wid in self.manager.workers:
                     self.manager.restart_worker(wid)
-            threading.Thread(target=restart_thread, daemon=True).start()
+            self._action_exec.submit(restart_thread)
 
     def _restart_worker(self, worker_id: str):
         """Restart a specific worker."""
         if self.manager and worker_id in self.manager.workers:
             self._log(f"Restarting {worker_id}...")
-            threading.Thread(target=lambda: self.manager.restart_worker(worker_id), daemon=True).start()
+            self._action_exec.submit(self.manager.restart_worker, worker_id)
 
     def _stop_worker(self, worker_id: str):
         """Stop a specific worker."""
         if self.manager and worker_id in self.manager.workers:
             self._log(f"Stopping {worker_id}...")
-            threading.Thread(target=lambda: self.manager.stop_worker(worker_id), daemon=True).start()
+            self._action_exec.submit(self.manager.stop_worker, worker_id)
 
     def _restart_all_chrome(self):
         """Restart all Chrome workers (fix connection issues)."""
         if self.manager:
             self._log("[Fix] Restarting all Chrome workers...")
-            threading.Thread(target=self.manager.restart_all_chrome, daemon=True).start()
+            self._action_exec.submit(self.manager.restart_all_chrome)
         else:
             messagebox.showwarning("Warning", "Manager not started")
 
@@ -1878,7 +1883,7 @@ class VMManagerGUI:
         """Rotate IPv6."""
         if self.manager and self.manager.ipv6_manager:
             self._log("Rotating IPv6...")
-            threading.Thread(target=self.manager.perform_ipv6_rotation, daemon=True).start()
+            self._action_exec.submit(self.manager.perform_ipv6_rotation)
         else:
             messagebox.showwarning("Warning", "IPv6 Manager not available")
 
@@ -1948,7 +1953,7 @@ class VMManagerGUI:
             finally:
                 self.update_btn.configure(state="normal")
 
-        threading.Thread(target=do_update, daemon=True).start()
+        self._action_exec.submit(do_update)
 
     def _open_settings(self):
         """Open settings dialog."""
@@ -2667,6 +2672,12 @@ def main():
 
     # Handle close - kill all child processes
     def on_closing():
+        # Executor thread không phải daemon - hủy task đang chờ để không
+        # giữ process sống sau khi đóng cửa sổ (cancel_futures chỉ có từ 3.9)
+        if sys.version_info >= (3, 9):
+            app._action_exec.shutdown(wait=False, cancel_futures=True)
+        else:
+            app._action_exec.shutdown(wait=False)
         if app.manager:
             print("[GUI] Stopping all workers...")
             app.manager.stop_all()
@@ -2677,13 +2688,16 @@ def main():
         import subprocess
         import sys
         if sys.platform == "win32":
-            # Kill worker scripts specifically
+            # Kill worker scripts specifically - 1 lần wmic argv list cho cả
+            # 3 script (OR trong where clause), không qua cmd.exe trung gian
             try:
-                for script in ["_run_chrome1.py", "_run_chrome2.py", "run_excel_api.py"]:
-                    subprocess.run(
-                        f'wmic process where "commandline like \'%{script}%\'" call terminate',
-                        shell=True, capture_output=True, timeout=5
-                    )
+                scripts = ["_run_chrome1.py", "_run_chrome2.py", "run_excel_api.py"]
+                clause = " or ".join(f"commandline like '%{s}%'" for s in scripts)
+                subprocess.run(
+                    ["wmic", "process", "where", clause, "call", "terminate"],
+                    capture_output=True, timeout=5,
+                    creationflags=subprocess.CREATE_NO_WINDOW
+                )
             except:
                 pass
 